@@ -0,0 +1,7 @@
+"""캐시 모듈 (TTS 오디오 디스크 캐시, 프로세스 내 TTL 캐시, 접두어 캐시, single-flight)"""
+from .prefix_cache import PrefixCache
+from .singleflight import SingleFlight, single_flight, singleflight_stats
+from .ttl_cache import AsyncTTLCache
+from .tts_cache import tts_cache
+
+__all__ = ["AsyncTTLCache", "PrefixCache", "SingleFlight", "single_flight", "singleflight_stats", "tts_cache"]
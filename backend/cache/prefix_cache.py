@@ -0,0 +1,77 @@
+"""
+접두어 캐시 - 자동완성처럼 글자를 하나씩 늘려 가며 검색하는 요청용.
+정확히 같은 검색어가 없으면 더 짧은 접두어의 '완전한' 결과(업스트림 전체 결과가 다 담긴 경우)를 걸러서 응답
+"""
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class PrefixCache:
+    """
+    key → (결과 리스트, 완전 여부, 만료 시각). 키는 호출 측에서 정규화한 검색어.
+    - 완전(complete): 업스트림 전체 결과를 다 받음 (마지막 페이지 등) → 더 긴 검색어의 결과는 이 안에 모두 있음
+    - 접두어 탐색은 검색어의 접두어를 긴 것부터 사전 조회 (검색어 길이만큼, 트리 불필요)
+    - 개수 제한 초과 시 가장 오래 안 쓴 항목부터 삭제 (LRU)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        match: Callable[[dict, str], bool],
+        max_entries: int = 4096,
+        ttl: float = 86400.0,
+    ):
+        self.name = name
+        self.match = match
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple[list, bool, float]]" = OrderedDict()
+        self.hits = 0
+        self.prefix_hits = 0
+        self.misses = 0
+
+    def _entry(self, key: str, now: float) -> Optional[tuple[list, bool, float]]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[2] <= now:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return entry
+
+    def get(self, key: str, limit: int) -> Optional[list]:
+        """캐시로 답할 수 있으면 결과 (최대 limit건), 없으면 None"""
+        if not key:
+            return None
+        now = time.time()
+        entry = self._entry(key, now)
+        if entry is not None and (entry[1] or len(entry[0]) >= limit):
+            self.hits += 1
+            return entry[0][:limit]
+        for end in range(len(key) - 1, 0, -1):
+            entry = self._entry(key[:end], now)
+            if entry is None or not entry[1]:
+                continue
+            self.prefix_hits += 1
+            return [item for item in entry[0] if self.match(item, key)][:limit]
+        self.misses += 1
+        return None
+
+    def set(self, key: str, results: list, complete: bool):
+        if not key:
+            return
+        self._data[key] = (list(results), complete, time.time() + self.ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "prefix_hits": self.prefix_hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,98 @@
+"""
+single-flight - 같은 키로 동시에 들어온 비동기 호출을 업스트림 요청 1회로 합침
+"""
+import asyncio
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+# 이름 → SingleFlight (메트릭 조회용)
+_groups: dict[str, "SingleFlight"] = {}
+
+
+class SingleFlight:
+    """
+    키별로 진행 중인 작업(Task)을 1개만 유지하고, 같은 키 호출자는 그 결과를 함께 기다림.
+    - 결과/예외는 해당 키로 기다리던 모든 호출자에게 그대로 전달 (다른 키에는 영향 없음)
+    - 작업은 별도 Task로 실행되므로, 처음 호출한 요청이 취소돼도 나머지 호출자는 결과를 받음
+    - 작업이 끝나면 키를 지우므로 결과를 보관하지 않음 (캐시는 AsyncTTLCache 등에서)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._tasks: dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.executions = 0
+        self.shared = 0
+        self.errors = 0
+        _groups[name] = self
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._tasks
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.calls += 1
+        task = self._tasks.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(self._run(key, fn))
+            task.add_done_callback(_consume_exception)
+            self._tasks[key] = task
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    async def _run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            return await fn()
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self._tasks.pop(key, None)
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "shared": self.shared,
+            "errors": self.errors,
+            "inflight": len(self._tasks),
+        }
+
+
+def _consume_exception(task: asyncio.Task):
+    # 모든 호출자가 취소돼 아무도 결과를 안 받은 경우 "exception was never retrieved" 경고 방지
+    if not task.cancelled():
+        task.exception()
+
+
+def single_flight(name: str, key: Optional[Callable[..., Hashable]] = None):
+    """
+    async 함수 데코레이터. key가 없으면 (기본값 포함) 바인딩된 인자 전체를 키로 사용.
+    예) @single_flight("deezer_search", key=lambda q, limit=30: (q.strip(), limit))
+    """
+    def decorator(fn):
+        group = SingleFlight(name)
+        sig = inspect.signature(fn)
+
+        def make_key(args, kwargs) -> Hashable:
+            if key is not None:
+                return key(*args, **kwargs)
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return tuple(bound.arguments.items())
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return await group.do(make_key(args, kwargs), lambda: fn(*args, **kwargs))
+
+        wrapper.single_flight = group
+        return wrapper
+
+    return decorator
+
+
+def singleflight_stats() -> dict:
+    """전체 single-flight 그룹 메트릭"""
+    return {name: group.stats() for name, group in _groups.items()}
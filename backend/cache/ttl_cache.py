@@ -0,0 +1,135 @@
+"""
+프로세스 내 TTL 캐시 - 항목별 만료 시각, LRU 개수 제한, 동일 키 동시 미스는 로더 1회로 합침 (SingleFlight),
+만료 후 stale 구간에는 이전 값을 바로 주고 백그라운드에서 갱신 (stale-while-revalidate)
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class AsyncTTLCache:
+    """
+    asyncio용 TTL 캐시 (단일 이벤트 루프 전제, 락 없음).
+    만료 시각은 time.time() 기준이라 '다음 정시' 같은 벽시계 정렬 만료에 사용 가능.
+    """
+
+    def __init__(self, name: str, max_entries: int = 1024, default_ttl: float = 60.0):
+        self.name = name
+        self.max_entries = max(1, max_entries)
+        self.default_ttl = default_ttl
+        # key → (value, 신선 만료 시각, stale 허용 만료 시각)
+        self._data: "OrderedDict[Hashable, tuple[Any, float, float]]" = OrderedDict()
+        self._flight = SingleFlight(f"cache:{name}")
+        self._background: set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refresh_errors = 0
+
+    def _lookup(self, key: Hashable) -> tuple[Any, bool]:
+        """(값, 신선 여부). 없거나 stale 구간도 지나면 (_MISSING, False)."""
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING, False
+        value, expires_at, stale_until = entry
+        now = time.time()
+        if stale_until <= now:
+            del self._data[key]
+            return _MISSING, False
+        self._data.move_to_end(key)
+        return value, expires_at > now
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """만료 전 값 (없으면 default)"""
+        value, fresh = self._lookup(key)
+        return value if fresh else default
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """stale 구간 값까지 포함해 조회 (통계·LRU 순서 변경 없음)"""
+        entry = self._data.get(key)
+        if entry is None or entry[2] <= time.time():
+            return default
+        return entry[0]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        expires_at: Optional[float] = None,
+        stale_ttl: float = 0.0,
+    ):
+        """저장. expires_at(epoch 초)이 있으면 우선, 없으면 now + ttl. 만료 후 stale_ttl초 동안은 stale 값으로 사용 가능."""
+        if expires_at is None:
+            expires_at = time.time() + (self.default_ttl if ttl is None else ttl)
+        self._data[key] = (value, expires_at, expires_at + max(0.0, stale_ttl))
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        self._data.pop(key, None)
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        expires_at: Optional[Callable[[], float]] = None,
+        stale_ttl: float = 0.0,
+    ) -> Any:
+        """
+        캐시 히트면 바로 반환. 미스면 loader() 실행 후 저장.
+        같은 키로 진행 중인 loader가 있으면 그 결과를 함께 기다림 (예외도 그대로 전달, 캐시하지 않음).
+        expires_at: 저장 시점에 호출되는 만료 시각 계산 함수 (ttl보다 우선).
+        stale_ttl > 0: 만료 후 그 시간 동안은 이전 값을 즉시 반환하고 백그라운드에서 loader 실행.
+        """
+        value, fresh = self._lookup(key)
+        if value is not _MISSING:
+            if fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+                if key not in self._flight:
+                    task = asyncio.create_task(self._refresh(key, loader, ttl, expires_at, stale_ttl))
+                    self._background.add(task)
+                    task.add_done_callback(self._background.discard)
+            return value
+        if key not in self._flight:
+            self.misses += 1
+        return await self._load(key, loader, ttl, expires_at, stale_ttl)
+
+    async def _load(self, key, loader, ttl, expires_at, stale_ttl) -> Any:
+        async def load_and_store():
+            value = await loader()
+            self.set(key, value, ttl=ttl, expires_at=expires_at() if expires_at else None, stale_ttl=stale_ttl)
+            return value
+
+        return await self._flight.do(key, load_and_store)
+
+    async def _refresh(self, key, loader, ttl, expires_at, stale_ttl):
+        """백그라운드 갱신. 실패하면 stale 값 유지."""
+        try:
+            await self._load(key, loader, ttl, expires_at, stale_ttl)
+        except Exception as e:
+            self.refresh_errors += 1
+            logger.warning("캐시 백그라운드 갱신 실패 (%s, key=%s): %s", self.name, key, e)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._data),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self._flight.shared,
+            "refresh_errors": self.refresh_errors,
+        }
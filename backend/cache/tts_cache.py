@@ -0,0 +1,207 @@
+"""
+TTS 오디오 디스크 캐시 - (speaker, speed, volume, pitch, format, 정규화 텍스트) 해시로 MP3 저장, 용량 초과 시 LRU 삭제
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from backend.core import settings
+
+logger = logging.getLogger(__name__)
+
+_KEY_FIELDS = ("speaker", "speed", "volume", "pitch", "format")
+
+
+def normalize_tts_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (NFC + 공백 정리)"""
+    return unicodedata.normalize("NFC", " ".join((text or "").split()))
+
+
+class TTSCacheWriter:
+    """스트리밍 응답을 받으면서 임시 파일에 조각 단위로 기록. commit() 시 캐시에 등록, abort() 시 폐기."""
+
+    def __init__(self, cache: "TTSAudioCache", key: str, path: Path, tmp: Path):
+        self._cache = cache
+        self._key = key
+        self._path = path
+        self._tmp = tmp
+        self._fh = open(tmp, "wb")
+        self._size = 0
+        self._failed = False
+
+    def write(self, chunk: bytes):
+        if self._failed or not chunk:
+            return
+        self._size += len(chunk)
+        if self._size > self._cache.max_bytes:
+            # 캐시 전체 용량보다 큰 음성은 저장하지 않음
+            self._failed = True
+            return
+        try:
+            self._fh.write(chunk)
+        except OSError as e:
+            logger.warning("TTS 캐시 쓰기 실패: %s", e)
+            self._failed = True
+
+    def commit(self) -> Optional[Path]:
+        if self._failed or self._size == 0:
+            self.abort()
+            return None
+        try:
+            self._fh.close()
+            os.replace(self._tmp, self._path)
+        except OSError as e:
+            logger.warning("TTS 캐시 저장 실패: %s", e)
+            self.abort()
+            return None
+        self._cache._register(self._key, self._path, self._size)
+        return self._path
+
+    def abort(self):
+        try:
+            self._fh.close()
+        except OSError:
+            pass
+        self._tmp.unlink(missing_ok=True)
+
+
+class TTSAudioCache:
+    """
+    파일 1개 = 음성 1건 ({key}.{format}). 메모리에는 key → 파일 크기만 LRU 순서로 보관.
+    파일 mtime을 마지막 사용 시각으로 써서 재시작 후에도 LRU 순서 유지.
+    """
+
+    def __init__(self):
+        self.directory = Path(settings.tts_cache_dir)
+        self.max_bytes = max(0, settings.tts_cache_max_mb) * 1024 * 1024
+        self.enabled = settings.tts_cache_enabled and self.max_bytes > 0
+        self._index: "OrderedDict[str, tuple[Path, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(payload: dict) -> str:
+        """TTS 요청 payload → 캐시 키 (sha256)"""
+        parts = {f: str(payload.get(f) or "") for f in _KEY_FIELDS}
+        parts["text"] = normalize_tts_text(payload.get("text") or "")
+        raw = json.dumps(parts, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def load(self):
+        """디렉터리 스캔으로 인덱스 복원 (오래된 것부터)"""
+        if not self.enabled:
+            logger.info("TTS 캐시 비활성화")
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning("TTS 캐시 디렉터리 생성 실패: %s. 캐시 없이 실행됩니다.", e)
+            self.enabled = False
+            return
+        entries = []
+        for path in self.directory.iterdir():
+            if not path.is_file() or path.name.startswith("."):
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, path.stem, path, st.st_size))
+        entries.sort()
+        with self._lock:
+            self._index.clear()
+            self._total_bytes = 0
+            for _, key, path, size in entries:
+                self._index[key] = (path, size)
+                self._total_bytes += size
+            self._evict_locked()
+        logger.info("TTS 캐시 로드: %d건, %.1fMB", len(self._index), self._total_bytes / 1024 / 1024)
+
+    def get(self, key: str) -> Optional[Path]:
+        """캐시된 파일 경로 (없으면 None). 히트 시 최근 사용으로 갱신."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            path, size = entry
+            if not path.exists():
+                # 외부에서 삭제된 파일
+                del self._index[key]
+                self._total_bytes -= size
+                self.misses += 1
+                return None
+            self._index.move_to_end(key)
+            self.hits += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def open_writer(self, key: str, fmt: str) -> Optional[TTSCacheWriter]:
+        """조각 단위 저장용 writer (캐시 비활성/디렉터리 오류 시 None)"""
+        if not self.enabled:
+            return None
+        path = self.directory / f"{key}.{fmt or 'mp3'}"
+        tmp = self.directory / f".{key}.{os.getpid()}.{threading.get_ident()}.{id(path)}.tmp"
+        try:
+            return TTSCacheWriter(self, key, path, tmp)
+        except OSError as e:
+            logger.warning("TTS 캐시 임시 파일 생성 실패: %s", e)
+            return None
+
+    def put(self, key: str, fmt: str, data: bytes) -> Optional[Path]:
+        """음성 저장 (임시 파일에 쓴 뒤 rename). 실패해도 예외 없이 None."""
+        if not data:
+            return None
+        writer = self.open_writer(key, fmt)
+        if writer is None:
+            return None
+        writer.write(data)
+        return writer.commit()
+
+    def _register(self, key: str, path: Path, size: int):
+        with self._lock:
+            old = self._index.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[1]
+            self._index[key] = (path, size)
+            self._total_bytes += size
+            self._evict_locked()
+
+    def _evict_locked(self):
+        while self._total_bytes > self.max_bytes and self._index:
+            _, (path, size) = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning("TTS 캐시 파일 삭제 실패 %s: %s", path, e)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._index),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+tts_cache = TTSAudioCache()
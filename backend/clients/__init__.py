@@ -0,0 +1,5 @@
+"""외부 API 클라이언트 모듈 (업스트림 HTTP 커넥션 풀, Azure OpenAI)"""
+from .http import http_clients
+from .llm import azure_openai
+
+__all__ = ["http_clients", "azure_openai"]
@@ -0,0 +1,82 @@
+"""
+업스트림별 공유 httpx.AsyncClient - 요청마다 TCP/TLS 핸드셰이크를 하지 않도록 keep-alive 재사용
+"""
+import logging
+from typing import Optional
+
+import httpx
+
+from backend.core import settings
+
+logger = logging.getLogger(__name__)
+
+# 업스트림 이름 → 타임아웃 설정 필드
+UPSTREAM_TIMEOUTS = {
+    "weather": "http_timeout_weather",   # Open-Meteo
+    "deezer": "http_timeout_deezer",
+    "youtube": "http_timeout_youtube",   # YouTube Data API
+    "news": "http_timeout_news",         # 딥서치 뉴스
+    "kakao": "http_timeout_kakao",       # Kakao 로컬 (주소/키워드)
+    "odsay": "http_timeout_odsay",       # ODsay 대중교통
+    "subway": "http_timeout_subway",     # 서울시 지하철 실시간
+    "tts": "http_timeout_tts",           # 네이버 클로바 TTS
+}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class HTTPClientService:
+    """업스트림별 AsyncClient 보관. lifespan에서 connect/disconnect."""
+
+    def __init__(self):
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._http2: Optional[bool] = None
+
+    def _use_http2(self) -> bool:
+        if self._http2 is None:
+            self._http2 = bool(settings.http2_enabled) and _http2_available()
+            if settings.http2_enabled and not self._http2:
+                logger.warning("HTTP2_ENABLED=true 이지만 h2 패키지가 없습니다. HTTP/1.1로 동작합니다.")
+        return self._http2
+
+    def _create_client(self, name: str) -> httpx.AsyncClient:
+        total = float(getattr(settings, UPSTREAM_TIMEOUTS[name]))
+        timeout = httpx.Timeout(total, connect=min(settings.http_connect_timeout, total))
+        limits = httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+        )
+        return httpx.AsyncClient(timeout=timeout, limits=limits, http2=self._use_http2())
+
+    async def connect(self):
+        """업스트림별 클라이언트 생성"""
+        for name in UPSTREAM_TIMEOUTS:
+            if name not in self._clients:
+                self._clients[name] = self._create_client(name)
+        logger.info("HTTP 클라이언트 풀 생성: %s (http2=%s)", ", ".join(self._clients), self._use_http2())
+
+    async def disconnect(self):
+        """모든 클라이언트 연결 종료"""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+        if clients:
+            logger.info("HTTP 클라이언트 풀 종료")
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """업스트림 클라이언트 반환. lifespan 밖(스크립트 등)에서 호출되면 지연 생성."""
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._create_client(name)
+            self._clients[name] = client
+        return client
+
+
+http_clients = HTTPClientService()
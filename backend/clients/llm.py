@@ -0,0 +1,93 @@
+"""
+Azure OpenAI 비동기 클라이언트 - 프로세스 전역 AsyncAzureOpenAI 1개 + 동시 호출 상한
+"""
+import asyncio
+import logging
+from typing import AsyncIterator, Optional
+
+import httpx
+from openai import AsyncAzureOpenAI, DefaultAsyncHttpxClient
+
+from backend.core import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AzureOpenAIService:
+    """AsyncAzureOpenAI 싱글톤. lifespan에서 connect/disconnect."""
+
+    def __init__(self):
+        self.client: Optional[AsyncAzureOpenAI] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def configured(self) -> bool:
+        return bool(settings.azure_openai_api_key and settings.azure_openai_endpoint)
+
+    async def connect(self):
+        """클라이언트 생성 (키 없으면 None 유지)"""
+        if not self.configured:
+            logger.warning("AZURE_OPENAI_ENDPOINT/AZURE_OPENAI_API_KEY가 설정되지 않았습니다. 스크립트 생성을 사용할 수 없습니다.")
+            return
+        self.get_client()
+        logger.info(
+            "Azure OpenAI 클라이언트 생성 (동시 호출 상한 %d)", settings.azure_openai_max_concurrency
+        )
+
+    async def disconnect(self):
+        """클라이언트 연결 종료"""
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+            logger.info("Azure OpenAI 클라이언트 종료")
+
+    def get_client(self) -> Optional[AsyncAzureOpenAI]:
+        """클라이언트 반환. lifespan 밖에서 호출되면 지연 생성."""
+        if self.client is None and self.configured:
+            http_client = DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=settings.azure_openai_max_connections,
+                    max_keepalive_connections=settings.azure_openai_max_connections,
+                    keepalive_expiry=settings.http_keepalive_expiry,
+                ),
+            )
+            self.client = AsyncAzureOpenAI(
+                api_version=settings.azure_openai_api_version,
+                azure_endpoint=settings.azure_openai_endpoint,
+                api_key=settings.azure_openai_api_key,
+                timeout=settings.azure_openai_timeout,
+                max_retries=settings.azure_openai_max_retries,
+                http_client=http_client,
+            )
+        return self.client
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(max(1, settings.azure_openai_max_concurrency))
+        return self._semaphore
+
+    async def chat_completion(self, **kwargs):
+        """chat.completions.create (동시 호출 상한 적용). 클라이언트 없으면 RuntimeError."""
+        client = self.get_client()
+        if client is None:
+            raise RuntimeError("Azure OpenAI가 설정되지 않았습니다.")
+        async with self._get_semaphore():
+            return await client.chat.completions.create(**kwargs)
+
+    async def stream_chat_completion(self, **kwargs) -> AsyncIterator[str]:
+        """chat.completions.create(stream=True)의 텍스트 조각(delta)을 순서대로 반환. 스트림이 끝날 때까지 동시 호출 슬롯 점유."""
+        client = self.get_client()
+        if client is None:
+            raise RuntimeError("Azure OpenAI가 설정되지 않았습니다.")
+        async with self._get_semaphore():
+            stream = await client.chat.completions.create(stream=True, **kwargs)
+            async for chunk in stream:
+                # Azure는 콘텐츠 필터 결과만 담긴 빈 choices 청크를 보내기도 함
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+
+azure_openai = AzureOpenAIService()
@@ -1,3 +1,4 @@
 from .config import settings
+from .scheduler import DailyScheduler, parse_daily_times
 
-__all__ = ["settings"]
+__all__ = ["settings", "DailyScheduler", "parse_daily_times"]
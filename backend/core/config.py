@@ -17,6 +17,10 @@ class Settings(BaseSettings):
     azure_openai_api_version: str = "2024-12-01-preview"
     azure_openai_endpoint: str = ""
     azure_openai_api_key: str = ""
+    azure_openai_timeout: float = 60.0
+    azure_openai_max_retries: int = 2
+    azure_openai_max_concurrency: int = 32  # 워커당 동시 LLM 호출 상한
+    azure_openai_max_connections: int = 64
 
     # 모델
     model_name: str = "gpt-4o"
@@ -27,24 +31,94 @@ class Settings(BaseSettings):
     # 서버
     app_port: int = 9100
 
+    # 날씨 캐시 (좌표를 격자에 맞춰 같은 동네는 같은 예보 공유, 매 정시 모델 갱신에 맞춰 만료)
+    weather_grid_deg: float = 0.05
+    weather_cache_refresh_minute: int = 5  # 매시 N분에 만료 (Open-Meteo 정시 갱신 반영 여유)
+    weather_cache_max_entries: int = 2048
+
     # 음악 검색 (YouTube Data API 키, Deezer는 키 불필요)
     youtube_api_key: str = ""
+    # Deezer 차트 캐시 (soft TTL 지나면 이전 차트 즉시 반환 + 백그라운드 갱신, 갱신 실패 시 stale 유지)
+    music_chart_ttl: float = 1800.0
+    music_chart_stale_ttl: float = 7 * 24 * 3600.0
+    # YouTube 쿼터 예산 (태평양 시간 자정 초기화). 한도 - 예비분을 넘으면 캐시/Deezer로 대체
+    youtube_daily_quota: int = 10000
+    youtube_quota_reserve: int = 500
+    youtube_search_cache_ttl: float = 24 * 3600.0
+    youtube_search_stale_ttl: float = 30 * 24 * 3600.0  # 쿼터 부족 시 대체로 쓸 수 있는 기간
+    youtube_duration_cache_ttl: float = 90 * 24 * 3600.0
 
     # 뉴스 (딥서치 국내 뉴스 API 키)
     deepsearch_news_api_key: str = ""
+    # 섹션별 기사 목록 공유 캐시 (만료 후 stale 구간엔 이전 목록 반환 + 백그라운드 갱신)
+    news_cache_ttl: float = 300.0
+    news_cache_stale_ttl: float = 1800.0
+    news_cache_page_size: int = 15  # 섹션당 한 번에 받아 두는 기사 수 (호출부는 잘라서 사용)
 
     # TTS (네이버 클로바 TTS Premium)
     ncp_tts_client_id: str = ""
     ncp_tts_client_secret: str = ""
+    # TTS 오디오 디스크 캐시 (동일 텍스트·보이스 재요청 시 업스트림 호출 없음)
+    tts_cache_enabled: bool = True
+    tts_cache_dir: str = ".cache/tts"  # 프로젝트 루트 기준
+    tts_cache_max_mb: int = 512  # 초과 시 오래 안 쓴 파일부터 삭제
+    # 긴 대본 분할 합성 (/tts?chunked=true)
+    tts_chunk_max_chars: int = 300  # 청크당 최대 글자 수 (문장 경계 기준)
+    tts_chunk_concurrency: int = 4  # 요청당 동시 합성 청크 수
 
     # 장소 자동완성 (Kakao 로컬 API)
     kakao_rest_key: str = ""
+    geocode_cache_ttl: float = 30 * 24 * 3600.0  # 장소명 → 좌표 (집·회사 등 같은 문자열이 매일 반복)
+    geocode_negative_ttl: float = 6 * 3600.0  # "찾을 수 없음" 결과 유지 시간
+    place_autocomplete_cache_ttl: float = 24 * 3600.0
+    place_autocomplete_cache_max_entries: int = 4096
 
     # 대중교통 경로 검색 (ODsay API)
     odsay_api_key: str = ""
+    nav_route_cache_ttl: float = 7 * 24 * 3600.0  # 같은 요일 유형·시간대의 경로는 한 주 동안 재사용
+    nav_route_snap_deg: float = 0.001  # 출발/도착 좌표 스냅 격자 (약 100m)
+    nav_route_time_bucket_minutes: int = 60  # 시간대 구간 (KST)
+    nav_route_session_ttl: float = 3 * 3600.0  # /nav/route 가 등록한 경로(route_id) 유지 시간, 추적 요청마다 연장
+    nav_route_session_touch_interval: float = 10 * 60.0  # MongoDB 사본 만료 연장 최소 간격 (추적 요청마다 쓰지 않도록)
 
     # 서울시 지하철 실시간 도착정보 (공공데이터)
     seoul_subway_api_key: str = ""
+    seoul_subway_format: str = "json"  # json | xml (json이 응답·파싱 모두 가벼움)
+    subway_arrival_cache_ttl: float = 12.0  # 역별 도착정보 공유 시간 (초). 폴링 사용자가 많아도 역당 1회 조회
+    nav_track_push_interval: float = 15.0  # /nav/track/ws 구독 역 도착정보 갱신 주기 (초, 역당 타이머 1개)
+    nav_track_window: int = 8  # 점진 추적: 직전 위치부터 앞쪽 탐색 포인트 수
+    nav_track_corridor_m: float = 300.0  # 경로에서 이만큼 벗어나면 전체 재탐색
+    nav_track_hysteresis_m: float = 50.0  # 역 근처·탑승 판정 이력 거리
+    nav_tracker_ttl: float = 30 * 60.0  # 폴링(tracker_id) 추적 상태 유지 시간
+
+    # 업스트림 HTTP 커넥션 풀 (업스트림별 AsyncClient 1개, keep-alive 재사용)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http2_enabled: bool = False  # h2 패키지 필요 (pip install "httpx[http2]"), 없으면 HTTP/1.1
+    http_connect_timeout: float = 10.0
+    # 업스트림별 읽기·쓰기 타임아웃(초). 연결 타임아웃은 http_connect_timeout 과 중 작은 값
+    http_timeout_weather: float = 20.0
+    http_timeout_deezer: float = 15.0
+    http_timeout_youtube: float = 15.0
+    http_timeout_news: float = 15.0
+    http_timeout_kakao: float = 10.0
+    http_timeout_odsay: float = 15.0
+    http_timeout_subway: float = 8.0
+    http_timeout_tts: float = 30.0
+
+    # 뉴스 멘트 LLM 대본 캐시 (같은 뉴스·DJ면 결과 공유)
+    script_cache_enabled: bool = True
+    script_cache_ttl: int = 6 * 60 * 60
+    script_cache_max_entries: int = 512
+
+    # 출근 시간대 캐시 예열 (KST, 쉼표 구분 HH:MM). 날씨 캐시는 매시 5분 만료라 정시 10분에 맞춤
+    prewarm_enabled: bool = True
+    prewarm_on_startup: bool = False
+    prewarm_times: str = "06:40,07:10,08:10,09:10"
+    prewarm_weather_cells: str = "37.5665,126.9780;37.4979,127.0276;37.5219,126.9245;37.5563,126.9236"  # 위도,경도;... (시청·강남·여의도·홍대)
+    prewarm_news_section_sets: str = "all"  # 세미콜론으로 여러 세트, 각 세트는 쉼표 구분 섹션 (/news?sections= 와 동일)
+    prewarm_news_count: int = 3  # 뉴스 멘트 기사 수 (프론트 radioRatio 기본값)
 
     # Google OAuth (로그인)
     google_client_id: str = ""
@@ -0,0 +1,114 @@
+"""
+하루 중 정해진 시각(기본 KST)마다 비동기 작업을 실행하는 프로세스 내 스케줄러
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _get_timezone(name: str):
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(name)
+    except Exception:
+        # tzdata 없는 환경: 한국 표준시 고정 오프셋
+        return timezone(timedelta(hours=9))
+
+
+def parse_daily_times(spec: str) -> list[tuple[int, int]]:
+    """ "06:40,07:10" → [(6, 40), (7, 10)] (잘못된 항목은 무시)"""
+    out = []
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            hh, mm = part.split(":")
+            h, m = int(hh), int(mm)
+        except ValueError:
+            logger.warning("스케줄 시각 형식 오류 (HH:MM): %s", part)
+            continue
+        if 0 <= h < 24 and 0 <= m < 60:
+            out.append((h, m))
+    return sorted(set(out))
+
+
+class DailyScheduler:
+    """lifespan에서 start()/stop(). 작업이 실패해도 다음 시각에 다시 실행."""
+
+    def __init__(self, name: str, times: list[tuple[int, int]], job: Callable[[], Awaitable[None]], tz: str = "Asia/Seoul"):
+        self.name = name
+        self.times = times
+        self.job = job
+        self.tz = _get_timezone(tz)
+        self._task: Optional[asyncio.Task] = None
+        self._running: Optional[asyncio.Task] = None
+        self.last_run_at: Optional[datetime] = None
+        self.last_duration_s: Optional[float] = None
+
+    def next_run_at(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        if not self.times:
+            return None
+        now = now or datetime.now(self.tz)
+        for day in (0, 1):
+            base = (now + timedelta(days=day)).replace(second=0, microsecond=0)
+            for h, m in self.times:
+                candidate = base.replace(hour=h, minute=m)
+                if candidate > now:
+                    return candidate
+        return None
+
+    def start(self):
+        if self._task is None and self.times:
+            self._task = asyncio.create_task(self._loop())
+            logger.info("스케줄러 시작 (%s): %s", self.name, ", ".join(f"{h:02d}:{m:02d}" for h, m in self.times))
+
+    async def stop(self):
+        for task in (self._task, self._running):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._task = None
+        self._running = None
+
+    async def run_now(self):
+        """즉시 1회 실행 (이미 실행 중이면 그 실행을 기다림)"""
+        if self._running is None or self._running.done():
+            self._running = asyncio.create_task(self._run_job())
+        await asyncio.shield(self._running)
+
+    async def _run_job(self):
+        started = datetime.now(self.tz)
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        try:
+            await self.job()
+        except Exception as e:
+            logger.exception("스케줄 작업 실패 (%s): %s", self.name, e)
+        finally:
+            self.last_run_at = started
+            self.last_duration_s = round(loop.time() - t0, 2)
+            logger.info("스케줄 작업 완료 (%s): %.1f초", self.name, self.last_duration_s)
+
+    async def _loop(self):
+        while True:
+            next_at = self.next_run_at()
+            if next_at is None:
+                return
+            delay = (next_at - datetime.now(self.tz)).total_seconds()
+            await asyncio.sleep(max(0.0, delay))
+            await self.run_now()
+
+    def stats(self) -> dict:
+        next_at = self.next_run_at()
+        return {
+            "next_run_at": next_at.isoformat() if next_at else None,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_duration_s": self.last_duration_s,
+        }
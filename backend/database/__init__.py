@@ -1,4 +1,6 @@
-"""MongoDB 데이터베이스 모듈 (무료 토큰 관리)"""
+"""MongoDB 데이터베이스 모듈 (무료 토큰 관리, 영속 캐시, API 쿼터)"""
+from .cache_store import MongoCacheStore
 from .database import mongodb_service
+from .quota import QuotaBudget
 
-__all__ = ["mongodb_service"]
+__all__ = ["mongodb_service", "MongoCacheStore", "QuotaBudget"]
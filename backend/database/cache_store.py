@@ -0,0 +1,103 @@
+"""
+MongoDB 영속 캐시 컬렉션 - 재시작/여러 워커 간 공유되는 key → value 저장 (MongoDB 없으면 동작 안 함)
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from .database import mongodb_service
+
+logger = logging.getLogger(__name__)
+
+
+class MongoCacheStore:
+    """
+    문서 형태: { _id: key, value, expires_at, purge_at }
+    - expires_at 이전: 신선한 값
+    - expires_at ~ purge_at: stale 값 (쿼터 부족 등 업스트림을 못 부를 때 대체용)
+    - purge_at: TTL 인덱스로 MongoDB가 자동 삭제
+    """
+
+    def __init__(self, collection_name: str):
+        self.collection_name = collection_name
+        self._indexed = False
+
+    async def _collection(self):
+        if mongodb_service.database is None:
+            return None
+        coll = mongodb_service.database[self.collection_name]
+        if not self._indexed:
+            self._indexed = True
+            try:
+                await coll.create_index("purge_at", expireAfterSeconds=0)
+            except Exception as e:
+                logger.warning(f"캐시 인덱스 생성 실패 (무시 가능, {self.collection_name}): {e}")
+        return coll
+
+    async def get(self, key: str) -> Optional[tuple[Any, bool]]:
+        """(값, 신선 여부). 없으면 None."""
+        coll = await self._collection()
+        if coll is None:
+            return None
+        try:
+            doc = await coll.find_one({"_id": key})
+        except Exception as e:
+            logger.warning(f"캐시 조회 실패 ({self.collection_name}): {e}")
+            return None
+        if not doc:
+            return None
+        now = datetime.utcnow()
+        if doc.get("purge_at") and doc["purge_at"] <= now:
+            return None
+        return doc.get("value"), bool(doc.get("expires_at") and doc["expires_at"] > now)
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """신선한 값만 {key: value}"""
+        coll = await self._collection()
+        if coll is None or not keys:
+            return {}
+        try:
+            cursor = coll.find({"_id": {"$in": list(keys)}, "expires_at": {"$gt": datetime.utcnow()}})
+            return {doc["_id"]: doc.get("value") async for doc in cursor}
+        except Exception as e:
+            logger.warning(f"캐시 조회 실패 ({self.collection_name}): {e}")
+            return {}
+
+    async def set(self, key: str, value: Any, ttl: float, stale_ttl: float = 0.0):
+        await self.set_many({key: value}, ttl, stale_ttl)
+
+    async def touch(self, key: str, ttl: float, stale_ttl: float = 0.0):
+        """값은 그대로 두고 만료 시각만 now + ttl 로 연장 (없는 키는 무시)"""
+        coll = await self._collection()
+        if coll is None:
+            return
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=ttl)
+        purge_at = expires_at + timedelta(seconds=max(0.0, stale_ttl))
+        try:
+            await coll.update_one({"_id": key}, {"$set": {"expires_at": expires_at, "purge_at": purge_at, "updated_at": now}})
+        except Exception as e:
+            logger.warning(f"캐시 만료 연장 실패 ({self.collection_name}): {e}")
+
+    async def set_many(self, items: dict[str, Any], ttl: float, stale_ttl: float = 0.0):
+        coll = await self._collection()
+        if coll is None or not items:
+            return
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=ttl)
+        purge_at = expires_at + timedelta(seconds=max(0.0, stale_ttl))
+        try:
+            from pymongo import UpdateOne
+            await coll.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": key},
+                        {"$set": {"value": value, "expires_at": expires_at, "purge_at": purge_at, "updated_at": now}},
+                        upsert=True,
+                    )
+                    for key, value in items.items()
+                ],
+                ordered=False,
+            )
+        except Exception as e:
+            logger.warning(f"캐시 저장 실패 ({self.collection_name}): {e}")
@@ -0,0 +1,104 @@
+"""
+일일 API 쿼터 예산 - 업스트림 호출 전에 단위를 차감하고, 예비분 아래로 내려가면 거절
+(MongoDB 있으면 워커/재시작 간 공유, 없으면 프로세스 메모리)
+"""
+import logging
+from datetime import datetime, timedelta, timezone
+
+from .database import mongodb_service
+
+logger = logging.getLogger(__name__)
+
+
+def _quota_timezone(name: str):
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(name)
+    except Exception:
+        # tzdata 없는 환경: 태평양 표준시 고정 오프셋
+        return timezone(timedelta(hours=-8))
+
+
+class QuotaBudget:
+    """하루 단위(reset_tz 자정 기준) 사용량 추적"""
+
+    COLLECTION = "api_quota"
+
+    def __init__(self, name: str, daily_limit: int, reserve: int = 0, reset_tz: str = "America/Los_Angeles"):
+        self.name = name
+        self.daily_limit = daily_limit
+        self.reserve = reserve
+        self._tz = _quota_timezone(reset_tz)
+        self._day = ""
+        self._used = 0
+        self._exhausted = False
+        self.denied = 0
+
+    def _roll_day(self) -> str:
+        day = datetime.now(self._tz).strftime("%Y-%m-%d")
+        if day != self._day:
+            self._day = day
+            self._used = 0
+            self._exhausted = False
+        return day
+
+    async def try_consume(self, units: int) -> bool:
+        """units만큼 차감. (한도 - 예비분)을 넘으면 차감하지 않고 False."""
+        day = self._roll_day()
+        allowed = self.daily_limit - self.reserve
+        if self._exhausted:
+            self.denied += 1
+            return False
+        if mongodb_service.database is not None:
+            coll = mongodb_service.database[self.COLLECTION]
+            doc_id = f"{self.name}:{day}"
+            try:
+                await coll.update_one(
+                    {"_id": doc_id},
+                    {"$setOnInsert": {"used": 0, "created_at": datetime.utcnow()}},
+                    upsert=True,
+                )
+                doc = await coll.find_one_and_update(
+                    {"_id": doc_id, "used": {"$lte": allowed - units}},
+                    {"$inc": {"used": units}, "$set": {"updated_at": datetime.utcnow()}},
+                    return_document=True,
+                )
+                if doc is None:
+                    self.denied += 1
+                    return False
+                self._used = doc.get("used", self._used)
+                return True
+            except Exception as e:
+                logger.warning(f"쿼터 DB 갱신 실패 ({self.name}), 메모리로 집계: {e}")
+        if self._used + units > allowed:
+            self.denied += 1
+            return False
+        self._used += units
+        return True
+
+    async def mark_exhausted(self):
+        """업스트림이 쿼터 초과를 알려온 경우: 오늘은 더 이상 호출하지 않음"""
+        day = self._roll_day()
+        self._exhausted = True
+        self._used = max(self._used, self.daily_limit)
+        logger.warning(f"{self.name} 일일 쿼터 소진 ({day})")
+        if mongodb_service.database is not None:
+            try:
+                await mongodb_service.database[self.COLLECTION].update_one(
+                    {"_id": f"{self.name}:{day}"},
+                    {"$max": {"used": self.daily_limit}, "$set": {"updated_at": datetime.utcnow()}},
+                    upsert=True,
+                )
+            except Exception as e:
+                logger.warning(f"쿼터 DB 갱신 실패 ({self.name}): {e}")
+
+    def stats(self) -> dict:
+        self._roll_day()
+        return {
+            "day": self._day,
+            "used": self._used,
+            "daily_limit": self.daily_limit,
+            "reserve": self.reserve,
+            "exhausted": self._exhausted,
+            "denied": self.denied,
+        }
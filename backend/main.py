@@ -4,20 +4,25 @@ Azure OpenAI 연동 FastAPI 서버 (kyobo2 구조 참고)
 - GET /weather: 날씨 API (Open-Meteo, 재사용 가능)
 - MongoDB: 로그인 계정별 무료 토큰 3개 제한
 """
+import asyncio
+import copy
+import hashlib
+import json
 import logging
-import math
-import xml.etree.ElementTree as ET
+import re
+import time
+import unicodedata
 from contextlib import asynccontextmanager
+from email.utils import formatdate, parsedate_to_datetime
 from urllib.parse import quote
 
 import httpx
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse, Response
+from fastapi.responses import FileResponse, JSONResponse, HTMLResponse, Response, StreamingResponse
 from fastapi import Request
-from pydantic import BaseModel
-from typing import Optional
-from openai import AzureOpenAI
+from pydantic import BaseModel, Field
+from typing import Awaitable, Callable, Optional, Union
 
 # 프로젝트 루트(cursor_hackathon)에서 실행 시 .env 로드
 import os
@@ -27,8 +32,11 @@ if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 os.chdir(ROOT)
 
-from backend.core import settings
-from backend.database import mongodb_service
+from backend.core import DailyScheduler, parse_daily_times, settings
+from backend.cache import AsyncTTLCache, PrefixCache, single_flight, singleflight_stats, tts_cache
+from backend.clients import azure_openai, http_clients
+from backend.database import MongoCacheStore, QuotaBudget, mongodb_service
+from backend.nav import ProgressTracker, RouteGeometry, StationRefresher, SubwayArrival, parse_arrivals_json, parse_arrivals_xml
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -36,9 +44,20 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app):
-    """앱 생명주기: MongoDB 연결/해제"""
+    """앱 생명주기: MongoDB 연결/해제, 업스트림 HTTP 클라이언트 풀·Azure OpenAI 클라이언트 생성/종료, TTS 캐시 로드, 캐시 예열 스케줄러"""
     await mongodb_service.connect()
+    await asyncio.to_thread(tts_cache.load)
+    await http_clients.connect()
+    await azure_openai.connect()
+    if settings.prewarm_enabled:
+        prewarm_scheduler.start()
+        if settings.prewarm_on_startup:
+            asyncio.create_task(prewarm_scheduler.run_now())
     yield
+    await prewarm_scheduler.stop()
+    await station_refresher.stop()
+    await azure_openai.disconnect()
+    await http_clients.disconnect()
     await mongodb_service.disconnect()
 
 
@@ -74,14 +93,8 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 
 def get_azure_client():
-    if not settings.azure_openai_api_key or not settings.azure_openai_endpoint:
-        return None
-    return AzureOpenAI(
-        api_version=settings.azure_openai_api_version,
-        azure_endpoint=settings.azure_openai_endpoint,
-        api_key=settings.azure_openai_api_key,
-        timeout=60.0,
-    )
+    """프로세스 전역 AsyncAzureOpenAI (설정 없으면 None)"""
+    return azure_openai.get_client()
 
 
 # --- 날씨 API (Open-Meteo, 재사용) ---
@@ -137,18 +150,40 @@ def _format_slot_rain(label: str, slot: dict) -> str:
     return f"☔ {label} 비/눈 예보 있음{mm}"
 
 
+# 격자 셀 → Open-Meteo 응답 (매시 weather_cache_refresh_minute 분에 만료)
+weather_cache = AsyncTTLCache("weather", max_entries=settings.weather_cache_max_entries)
+
+
+def _snap_to_grid(lat: float, lon: float) -> tuple[float, float]:
+    """좌표를 weather_grid_deg 격자 중심으로 맞춤 (같은 셀 = 같은 캐시 키)"""
+    step = settings.weather_grid_deg
+    if step <= 0:
+        return round(lat * 1e5) / 1e5, round(lon * 1e5) / 1e5
+    return round(round(lat / step) * step, 5), round(round(lon / step) * step, 5)
+
+
+def _next_weather_refresh_at() -> float:
+    """다음 모델 갱신 시각 (epoch 초): 다음 정시 + refresh_minute 분"""
+    now = time.time()
+    offset = max(0, min(settings.weather_cache_refresh_minute, 59)) * 60
+    return (now - offset) // 3600 * 3600 + 3600 + offset
+
+
+async def _fetch_open_meteo(lat: float, lon: float) -> dict:
+    url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current=temperature_2m,weather_code&hourly=weather_code,precipitation&timezone=Asia/Seoul"
+    # 타임아웃: 연결 10초 + 읽기 20초 (settings.http_timeout_weather)
+    r = await http_clients.get("weather").get(url)
+    r.raise_for_status()
+    return r.json()
+
+
 async def fetch_weather_text(lat: float = 37.5665, lon: float = 126.9780, location_name: str = "서울") -> str:
-    """날씨 정보 가져오기 (타임아웃 및 예외 처리 개선)"""
+    """날씨 정보 가져오기 (격자 캐시, 타임아웃 및 예외 처리 개선)"""
     try:
-        lat5 = round(lat * 1e5) / 1e5
-        lon5 = round(lon * 1e5) / 1e5
-        url = f"https://api.open-meteo.com/v1/forecast?latitude={lat5}&longitude={lon5}&current=temperature_2m,weather_code&hourly=weather_code,precipitation&timezone=Asia/Seoul"
-        # 타임아웃을 30초로 증가 (연결 10초 + 읽기 20초)
-        timeout = httpx.Timeout(10.0, connect=10.0, read=20.0)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            r = await client.get(url)
-            r.raise_for_status()
-            data = r.json()
+        cell = _snap_to_grid(lat, lon)
+        data = await weather_cache.get_or_load(
+            cell, lambda: _fetch_open_meteo(*cell), expires_at=_next_weather_refresh_at
+        )
         cur = data.get("current") or {}
         temp = cur.get("temperature_2m")
         code = cur.get("weather_code")
@@ -205,11 +240,11 @@ def _normalize_deezer_tracks(raw: list) -> list:
     ]
 
 
+@single_flight("deezer_chart")
 async def fetch_deezer_chart() -> list:
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        r = await client.get(f"{DEEZER_BASE}/chart/0/tracks", params={"limit": 50})
-        r.raise_for_status()
-        data = r.json()
+    r = await http_clients.get("deezer").get(f"{DEEZER_BASE}/chart/0/tracks", params={"limit": 50})
+    r.raise_for_status()
+    data = r.json()
     tracks_obj = data.get("tracks")
     if isinstance(tracks_obj, list):
         raw = tracks_obj
@@ -220,59 +255,152 @@ async def fetch_deezer_chart() -> list:
     return _normalize_deezer_tracks(raw if isinstance(raw, list) else [])
 
 
+@single_flight("deezer_search", key=lambda q, limit=30: ((q or "").strip(), limit))
 async def fetch_deezer_search(q: str, limit: int = 30) -> list:
     if not (q or q.strip()):
         return []
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        r = await client.get(f"{DEEZER_BASE}/search", params={"q": q.strip()[:200], "limit": limit})
-        r.raise_for_status()
-        data = r.json()
+    r = await http_clients.get("deezer").get(f"{DEEZER_BASE}/search", params={"q": q.strip()[:200], "limit": limit})
+    r.raise_for_status()
+    data = r.json()
     raw = data.get("data") or []
     return _normalize_deezer_tracks(raw)
 
 
+# YouTube Data API 쿼터: search.list 100, videos.list 1 단위
+YOUTUBE_SEARCH_COST = 100
+YOUTUBE_VIDEOS_COST = 1
+
+youtube_quota = QuotaBudget("youtube", daily_limit=settings.youtube_daily_quota, reserve=settings.youtube_quota_reserve)
+# 검색 결과 (정규화 검색어 + 최소 길이 + 개수) — 메모리(L1) + MongoDB(L2)
+youtube_search_cache = AsyncTTLCache("youtube_search", max_entries=1024)
+youtube_search_store = MongoCacheStore("youtube_search_cache")
+# videoId → 길이(초). 영상 길이는 바뀌지 않으므로 오래 보관
+youtube_duration_cache = AsyncTTLCache("youtube_duration", max_entries=20000)
+youtube_duration_store = MongoCacheStore("youtube_durations")
+
+
+class YouTubeQuotaExceeded(Exception):
+    """쿼터 예산 부족 또는 YouTube 403 quotaExceeded, 캐시도 없음 → Deezer 등으로 대체"""
+
+
+def _youtube_search_key(q: str, min_duration_sec: int, max_results: int) -> str:
+    normalized = " ".join((q or "").lower().split())[:200]
+    return f"{normalized}|{min_duration_sec}|{max_results}"
+
+
+def _is_youtube_quota_error(e: httpx.HTTPStatusError) -> bool:
+    return e.response.status_code == 403 and any(
+        reason in e.response.text for reason in ("quotaExceeded", "dailyLimitExceeded", "rateLimitExceeded")
+    )
+
+
+async def _get_youtube_durations(ids: list[str]) -> dict[str, int]:
+    """videoId → 길이(초). 캐시에 없는 것만 videos.list 1회 호출 (예산 없으면 생략)."""
+    durations = {}
+    for vid in ids:
+        dur = youtube_duration_cache.get(vid)
+        if dur is not None:
+            durations[vid] = dur
+    missing = [vid for vid in ids if vid not in durations]
+    if missing:
+        stored = await youtube_duration_store.get_many(missing)
+        for vid, dur in stored.items():
+            durations[vid] = dur
+            youtube_duration_cache.set(vid, dur, ttl=settings.youtube_duration_cache_ttl)
+        missing = [vid for vid in missing if vid not in durations]
+    if not missing or not await youtube_quota.try_consume(YOUTUBE_VIDEOS_COST):
+        return durations
+    r2 = await http_clients.get("youtube").get(
+        YOUTUBE_VIDEOS,
+        params={"part": "contentDetails", "id": ",".join(missing[:50]), "key": settings.youtube_api_key},
+    )
+    if r2.status_code != 200:
+        return durations
+    fetched = {}
+    for v in r2.json().get("items") or []:
+        dur_iso = (v.get("contentDetails") or {}).get("duration")
+        if v.get("id"):
+            fetched[v["id"]] = _parse_iso_duration(dur_iso)
+    for vid, dur in fetched.items():
+        youtube_duration_cache.set(vid, dur, ttl=settings.youtube_duration_cache_ttl)
+    await youtube_duration_store.set_many(fetched, ttl=settings.youtube_duration_cache_ttl)
+    durations.update(fetched)
+    return durations
+
+
+async def _youtube_search_uncached(q: str, min_duration_sec: int, max_results: int) -> tuple[list, bool]:
+    """(결과, 모든 영상 길이 확인 여부)"""
+    client = http_clients.get("youtube")
+    # videoCategoryId만 제거 (한글 검색 시 결과 나오도록). short = 4분 미만으로 짧은 곡만
+    r = await client.get(
+        YOUTUBE_SEARCH,
+        params={
+            "part": "snippet",
+            "type": "video",
+            "videoDuration": "short",
+            "maxResults": max_results,
+            "q": (q.strip()[:200] + " 음악"),
+            "key": settings.youtube_api_key,
+        },
+    )
+    r.raise_for_status()
+    data = r.json()
+    items = data.get("items") or []
+    candidates = [
+        {"videoId": it.get("id", {}).get("videoId"), "title": (it.get("snippet") or {}).get("title", "-"), "channelTitle": (it.get("snippet") or {}).get("channelTitle", "-")}
+        for it in items
+        if it.get("id", {}).get("videoId")
+    ]
+    if not candidates:
+        return [], True
+    ids = [c["videoId"] for c in candidates[:50]]
+    id_to_dur = await _get_youtube_durations(ids)
+    complete = all(vid in id_to_dur for vid in ids)
+    out = [{"videoId": c["videoId"], "title": c["title"], "channelTitle": c["channelTitle"], "duration_seconds": id_to_dur.get(c["videoId"], 0)} for c in candidates if id_to_dur.get(c["videoId"], 0) >= min_duration_sec]
+    return (out if out else [{**c, "duration_seconds": id_to_dur.get(c["videoId"], 0)} for c in candidates]), complete
+
+
+@single_flight(
+    "youtube_search",
+    key=lambda q, min_duration_sec=120, max_results=15: ((q or "").strip(), min_duration_sec, max_results),
+)
 async def fetch_youtube_search(q: str, min_duration_sec: int = 120, max_results: int = 15) -> list:
-    """YouTube 음악 검색. 2분 이상인 영상 우선, 없으면 전체 반환. API 키 필요."""
+    """
+    YouTube 음악 검색. 2분 이상인 영상 우선, 없으면 전체 반환. API 키 필요.
+    캐시(메모리 → MongoDB) 우선, 일일 쿼터 예산이 부족하면 stale 캐시 반환, 그것도 없으면 YouTubeQuotaExceeded.
+    """
     if not (settings.youtube_api_key and q and q.strip()):
         return []
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        # videoCategoryId만 제거 (한글 검색 시 결과 나오도록). short = 4분 미만으로 짧은 곡만
-        r = await client.get(
-            YOUTUBE_SEARCH,
-            params={
-                "part": "snippet",
-                "type": "video",
-                "videoDuration": "short",
-                "maxResults": max_results,
-                "q": (q.strip()[:200] + " 음악"),
-                "key": settings.youtube_api_key,
-            },
-        )
-        r.raise_for_status()
-        data = r.json()
-        items = data.get("items") or []
-        candidates = [
-            {"videoId": it.get("id", {}).get("videoId"), "title": (it.get("snippet") or {}).get("title", "-"), "channelTitle": (it.get("snippet") or {}).get("channelTitle", "-")}
-            for it in items
-            if it.get("id", {}).get("videoId")
-        ]
-        if not candidates:
-            return []
-        ids = [c["videoId"] for c in candidates[:50]]
-        r2 = await client.get(
-            YOUTUBE_VIDEOS,
-            params={"part": "contentDetails", "id": ",".join(ids), "key": settings.youtube_api_key},
+    key = _youtube_search_key(q, min_duration_sec, max_results)
+    cached = youtube_search_cache.get(key)
+    if cached is not None:
+        return cached
+    stored = await youtube_search_store.get(key)
+    if stored is not None and stored[1]:
+        youtube_search_cache.set(key, stored[0], ttl=settings.youtube_search_cache_ttl)
+        return stored[0]
+    stale = stored[0] if stored is not None else None
+
+    if not await youtube_quota.try_consume(YOUTUBE_SEARCH_COST):
+        if stale is not None:
+            logger.info("YouTube 쿼터 예산 부족 → stale 캐시 사용: q=%s", q)
+            return stale
+        raise YouTubeQuotaExceeded("YouTube 일일 쿼터 예산이 부족합니다.")
+    try:
+        out, complete = await _youtube_search_uncached(q, min_duration_sec, max_results)
+    except httpx.HTTPStatusError as e:
+        if not _is_youtube_quota_error(e):
+            raise
+        await youtube_quota.mark_exhausted()
+        if stale is not None:
+            return stale
+        raise YouTubeQuotaExceeded("YouTube 일일 쿼터가 소진되었습니다.") from e
+    if complete:
+        youtube_search_cache.set(key, out, ttl=settings.youtube_search_cache_ttl)
+        await youtube_search_store.set(
+            key, out, ttl=settings.youtube_search_cache_ttl, stale_ttl=settings.youtube_search_stale_ttl
         )
-        if r2.status_code != 200:
-            return [{"videoId": c["videoId"], "title": c["title"], "channelTitle": c["channelTitle"], "duration_seconds": 0} for c in candidates]
-        detail = r2.json()
-        id_to_dur = {}
-        for v in detail.get("items") or []:
-            dur_iso = (v.get("contentDetails") or {}).get("duration")
-            if v.get("id"):
-                id_to_dur[v["id"]] = _parse_iso_duration(dur_iso)
-        out = [{"videoId": c["videoId"], "title": c["title"], "channelTitle": c["channelTitle"], "duration_seconds": id_to_dur.get(c["videoId"], 0)} for c in candidates if id_to_dur.get(c["videoId"], 0) >= min_duration_sec]
-        return out if out else [{**c, "duration_seconds": id_to_dur.get(c["videoId"], 0)} for c in candidates]
+    return out
 
 
 # --- 뉴스 API (딥서치 국내 뉴스, 재사용) ---
@@ -290,39 +418,57 @@ def _normalize_article(a: dict) -> dict:
     }
 
 
+# 섹션 문자열 → 정규화된 기사 목록 (사용자 간 공유)
+news_cache = AsyncTTLCache("news", max_entries=256)
+
+
+async def _fetch_news_articles(sections: str, page_size: int) -> list:
+    """딥서치 기사 조회 (오늘 → 없으면 어제부터). HTTP 오류는 RuntimeError (캐시하지 않음)."""
+    from datetime import datetime, timedelta
+    today = datetime.now().strftime("%Y-%m-%d")
+    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+    client = http_clients.get("news")
+    url = f"{NEWS_BASE}/v1/articles/{sections}"
+    params = {"date_from": today, "date_to": today, "page": 1, "page_size": page_size, "api_key": settings.deepsearch_news_api_key}
+    r = await client.get(url, params=params)
+    if r.status_code != 200:
+        raise RuntimeError(f"뉴스 API 호출 실패: HTTP {r.status_code} (section={sections})")
+    data = r.json()
+    arr = data.get("data") if isinstance(data.get("data"), list) else []
+    if not arr:
+        params["date_from"] = yesterday
+        r2 = await client.get(url, params=params)
+        if r2.status_code != 200:
+            raise RuntimeError(f"뉴스 API 호출 실패 (어제 포함): HTTP {r2.status_code}")
+        data = r2.json()
+        arr = data.get("data") if isinstance(data.get("data"), list) else []
+    out = []
+    for a in arr or []:
+        row = _normalize_article(a)
+        if row["title"] and row["url"]:
+            out.append(row)
+    logger.info(f"뉴스 수집 성공: {len(out)}건 (section={sections})")
+    return out
+
+
 async def fetch_news(section: str = "all", page_size: int = 15) -> list:
     if not settings.deepsearch_news_api_key:
         logger.warning("DEEPSEARCH_NEWS_API_KEY가 설정되지 않았습니다. 뉴스 API를 사용할 수 없습니다.")
         return []
     sections = NEWS_SECTIONS_ALL if section == "all" or not section else section.strip()
-    from datetime import datetime, timedelta
-    today = datetime.now().strftime("%Y-%m-%d")
-    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+    # 섹션당 news_cache_page_size건을 한 번에 받아 두고 호출부마다 잘라서 사용 → page_size가 달라도 캐시 공유
+    fetch_size = max(page_size, settings.news_cache_page_size)
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            url = f"{NEWS_BASE}/v1/articles/{sections}"
-            params = {"date_from": today, "date_to": today, "page": 1, "page_size": page_size, "api_key": settings.deepsearch_news_api_key}
-            r = await client.get(url, params=params)
-            if r.status_code != 200:
-                logger.warning(f"뉴스 API 호출 실패: HTTP {r.status_code} (section={section})")
-                return []
-            data = r.json()
-            arr = data.get("data") if isinstance(data.get("data"), list) else []
-            if not arr:
-                params["date_from"] = yesterday
-                r2 = await client.get(url, params=params)
-                if r2.status_code != 200:
-                    logger.warning(f"뉴스 API 호출 실패 (어제 포함): HTTP {r2.status_code}")
-                    return []
-                data = r2.json()
-                arr = data.get("data") if isinstance(data.get("data"), list) else []
-            out = []
-            for a in arr or []:
-                row = _normalize_article(a)
-                if row["title"] and row["url"]:
-                    out.append(row)
-            logger.info(f"뉴스 수집 성공: {len(out)}건 (section={section})")
-            return out
+        articles = await news_cache.get_or_load(
+            (sections, fetch_size),
+            lambda: _fetch_news_articles(sections, fetch_size),
+            ttl=settings.news_cache_ttl,
+            stale_ttl=settings.news_cache_stale_ttl,
+        )
+        return articles[:page_size]
+    except RuntimeError as e:
+        logger.warning(str(e))
+        return []
     except Exception as e:
         logger.exception(f"뉴스 API 호출 중 예외 발생: {e}")
         return []
@@ -388,22 +534,28 @@ class NavRouteForTrack(BaseModel):
 
 
 class TrackPositionRequest(BaseModel):
-    """실시간 위치 기반 경로 상태 조회"""
+    """실시간 위치 기반 경로 상태 조회. route_id(/nav/route 응답) 또는 route 전체 중 하나"""
     lat: float  # 위도
     lng: float  # 경도
-    route: NavRouteForTrack
+    route_id: Optional[str] = None
+    route: Optional[NavRouteForTrack] = None
+    tracker_id: Optional[str] = None  # route_id와 함께 보내면 이전 위치부터 이어서 추적 (클라이언트별 임의 ID)
+
+
+class TrackFixForBatch(BaseModel):
+    lat: float
+    lng: float
+    t: Optional[Union[float, str]] = None  # 기록 시각 (epoch 초 또는 ISO 문자열, 응답에 그대로 반환)
 
 
-def _distance_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-    """두 좌표 간 거리(미터). Haversine 근사."""
-    R = 6371000  # 지구 반경 m
-    phi1 = math.radians(lat1)
-    phi2 = math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlam = math.radians(lng2 - lng1)
-    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlam / 2) ** 2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return R * c
+class TrackBatchRequest(BaseModel):
+    """GPS 기록 재생: 경로 1개 + 좌표 N개 → 상태 N개 (/nav/track 과 같은 계산)"""
+    route_id: Optional[str] = None
+    route: Optional[NavRouteForTrack] = None
+    fixes: list[TrackFixForBatch] = Field(..., max_length=10000)
+    incremental: bool = True  # true면 하나의 추적 세션처럼 이어서 판정 (tracker), false면 좌표마다 독립 판정
+    realtime: bool = True  # false면 실시간 도착정보를 조회하지 않고 stub_arrivals 사용
+    stub_arrivals: Optional[dict[str, list[dict]]] = None  # 역명 → 도착정보 목록 (realtime=false일 때, 없는 역은 빈 목록)
 
 
 def _build_route_points(route: dict) -> list[dict]:
@@ -463,42 +615,148 @@ def _build_route_points(route: dict) -> list[dict]:
 _AT_STATION_THRESHOLD_M = 250
 
 
-async def _compute_track_state(lat: float, lng: float, route: dict) -> dict:
+# --- 경로 세션: /nav/route 결과를 서버에 등록해 두고 /nav/track 은 route_id + 좌표만 받음 ---
+# route_id → {"route": 정규화된 경로 dict, "points": _build_route_points 결과}
+nav_route_sessions = AsyncTTLCache("nav_route_sessions", max_entries=4096, default_ttl=settings.nav_route_session_ttl)
+nav_route_session_store = MongoCacheStore("nav_route_sessions")
+# route_id → True: 최근에 MongoDB 사본 만료를 연장함 (연장 쓰기 간격 제한)
+nav_route_session_touched = AsyncTTLCache(
+    "nav_route_session_touched", max_entries=4096, default_ttl=settings.nav_route_session_touch_interval
+)
+
+
+def _route_geometry(points: list[dict]) -> RouteGeometry:
+    return RouteGeometry([(float(p["x"]), float(p["y"])) for p in points])
+
+
+def _first_subway_index(points: list[dict]) -> Optional[int]:
+    return next((i for i, p in enumerate(points) if p.get("is_first_subway")), None)
+
+
+def _compile_route(route: dict) -> dict:
+    points = _build_route_points(route)
+    return {
+        "route": route,
+        "points": points,
+        "geometry": _route_geometry(points),
+        "first_subway_idx": _first_subway_index(points),
+    }
+
+
+def _new_tracker(compiled: dict) -> ProgressTracker:
+    return ProgressTracker(
+        compiled["geometry"],
+        compiled["first_subway_idx"],
+        station_threshold_m=_AT_STATION_THRESHOLD_M,
+        window=settings.nav_track_window,
+        corridor_m=settings.nav_track_corridor_m,
+        hysteresis_m=settings.nav_track_hysteresis_m,
+    )
+
+
+# (route_id, tracker_id) → ProgressTracker (폴링 클라이언트용. WebSocket은 연결마다 보유)
+nav_trackers = AsyncTTLCache("nav_trackers", max_entries=8192, default_ttl=settings.nav_tracker_ttl)
+
+
+async def register_route_session(route_result: dict) -> str:
+    """경로 등록 → route_id. 같은 경로는 같은 ID (내용 해시)라 매일 같은 출근길은 재사용."""
+    route = NavRouteForTrack.model_validate(route_result).model_dump()
+    raw = json.dumps(route, ensure_ascii=False, sort_keys=True, default=str)
+    route_id = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:24]
+    compiled = nav_route_sessions.get(route_id)
+    nav_route_sessions.set(route_id, compiled if compiled is not None else _compile_route(route))
+    # 다른 워커에서 등록·만료 직전인 경우도 있어 메모리 여부와 관계없이 항상 갱신
+    await nav_route_session_store.set(route_id, route, ttl=settings.nav_route_session_ttl)
+    nav_route_session_touched.set(route_id, True)
+    return route_id
+
+
+async def get_route_session(route_id: str) -> Optional[dict]:
+    """컴파일된 경로 (없거나 만료면 None). 다른 워커·재시작 후에는 MongoDB에서 복원."""
+    compiled = nav_route_sessions.get(route_id)
+    if compiled is None:
+        stored = await nav_route_session_store.get(route_id)
+        if stored is None or not stored[1]:
+            return None
+        compiled = _compile_route(stored[0])
+    # 추적이 이어지는 동안 만료 연장 (MongoDB 사본은 touch_interval마다 1회)
+    nav_route_sessions.set(route_id, compiled)
+    if nav_route_session_touched.get(route_id) is None:
+        nav_route_session_touched.set(route_id, True)
+        await nav_route_session_store.touch(route_id, ttl=settings.nav_route_session_ttl)
+    return compiled
+
+
+def _before_boarding_message(station_name: Optional[str], at_station: bool) -> str:
+    """탑승 전 기본 문구 (도착정보 없을 때). 첫 역 근처면 대기, 아니면 역으로 이동 중"""
+    if not station_name:
+        return "출발지에서 첫 역으로 이동 중입니다."
+    if at_station:
+        return f"{station_name}에서 열차를 기다리는 중입니다."
+    return f"{station_name}역으로 이동 중입니다."
+
+
+async def _compute_track_state(
+    lat: float,
+    lng: float,
+    route: dict,
+    points: Optional[list[dict]] = None,
+    geometry: Optional[RouteGeometry] = None,
+    tracker: Optional[ProgressTracker] = None,
+    arrivals_lookup: Optional[Callable[[str], Awaitable[list]]] = None,
+) -> dict:
     """
     현재 위치(lat, lng)와 경로(route)를 비교해 상태 반환.
     - state: "BEFORE_BOARDING" | "ON_BOARD"
     - message: UI에 표시할 문구 (도착 N분 / 환승 알림 / 하차 알림)
     - arrival_minutes: 탑승 전일 때만, 가장 빨리 오는 열차 도착 분
     - stationName: 관련 역명
+    - segment_index / progress: 경로 선분에 투영한 위치 (구간 인덱스, 전체 대비 진행률 0~1)
+    points, geometry: 미리 만든 경로 포인트·기하 인덱스 (경로 세션). 없으면 route에서 생성.
+    tracker: 세션별 점진 추적기. 있으면 직전 위치부터 앞쪽만 탐색하고 탑승 판정도 추적기 상태를 따름.
+    arrivals_lookup: 역명 → 도착정보 (기본: 서울시 실시간 API, 재생·테스트용으로 대체 가능)
     """
-    points = _build_route_points(route)
+    if points is None:
+        points = _build_route_points(route)
     total_pts = len(points)
     if total_pts < 2:
         return {"state": "UNKNOWN", "message": "경로 정보가 없습니다.", "stationName": None, "arrival_minutes": None, "nearest_index": 0, "total_points": total_pts}
+    if geometry is None:
+        geometry = _route_geometry(points)
 
     # 위경도 비교: points[].x=경도, .y=위도
-    min_dist = float("inf")
-    nearest_idx = 0
-    for i, p in enumerate(points):
-        d = _distance_m(lat, lng, float(p["y"]), float(p["x"]))
-        if d < min_dist:
-            min_dist = d
-            nearest_idx = i
-
-    first_subway_idx = next((i for i, p in enumerate(points) if p.get("is_first_subway")), None)
+    fix = tracker.update(lat, lng) if tracker is not None else None
+    if fix is not None:
+        nearest_idx, min_dist, projection = fix.nearest_index, fix.distance_m, fix.projection
+    else:
+        nearest_idx, min_dist = geometry.nearest_point(lat, lng)
+        projection = geometry.project(lat, lng)
+    position = {
+        "nearest_index": nearest_idx,
+        "total_points": total_pts,
+        "segment_index": projection.segment_index,
+        "progress": round(projection.progress, 4),
+    }
+
+    first_subway_idx = _first_subway_index(points)
     if first_subway_idx is None:
-        return {"state": "ON_BOARD", "message": "이동 중입니다.", "stationName": None, "arrival_minutes": None, "nearest_index": nearest_idx, "total_points": total_pts}
+        return {"state": "ON_BOARD", "message": "이동 중입니다.", "stationName": None, "arrival_minutes": None, **position}
 
-    at_station = min_dist <= _AT_STATION_THRESHOLD_M
+    if fix is not None:
+        at_station = fix.at_station
+        before_boarding = fix.phase == "BEFORE_BOARDING"
+    else:
+        at_station = nearest_idx == first_subway_idx and min_dist <= _AT_STATION_THRESHOLD_M
+        before_boarding = nearest_idx < first_subway_idx or at_station
     # 탑승 전: 출발~첫 지하철역 구간 또는 첫 역 근처(대기)
-    if nearest_idx < first_subway_idx or (nearest_idx == first_subway_idx and at_station):
+    if before_boarding:
         first_pt = points[first_subway_idx]
         station_name = first_pt.get("stationName") or (route.get("legs") or [{}])[first_pt.get("legIndex", 0)].get("startName") if first_subway_idx < len(points) else None
         if not station_name and (route.get("legs") or []):
             leg = (route["legs"] or [])[first_pt.get("legIndex", 0)]
             station_name = leg.get("startName")
         # 실시간 도착 정보 조회
-        arrivals = await _get_realtime_subway_arrival(station_name or "")
+        arrivals = await (arrivals_lookup or _get_realtime_subway_arrival)(station_name or "")
         route_info = {"line": "", "stations": [], "destination": ""}
         if route.get("legs") and first_subway_idx >= 0:
             leg = route["legs"][first_pt.get("legIndex", 0)]
@@ -522,21 +780,19 @@ async def _compute_track_state(lat: float, lng: float, route: dict) -> dict:
                 "message": msg,
                 "stationName": station_name,
                 "arrival_minutes": arrival_min if arrival_min > 0 else None,
-                "nearest_index": nearest_idx,
-                "total_points": total_pts,
+                **position,
             }
         return {
             "state": "BEFORE_BOARDING",
-            "message": f"{station_name or '역'}에서 열차를 기다리는 중입니다." if station_name else "출발지에서 첫 역으로 이동 중입니다.",
+            "message": _before_boarding_message(station_name, at_station),
             "stationName": station_name,
             "arrival_minutes": None,
-            "nearest_index": nearest_idx,
-            "total_points": total_pts,
+            **position,
         }
 
-    # 탑승 중: 다음 지하철 역이 환승역인지, 최종 하차역인지
+    # 탑승 중: 다음 지하철 역이 환승역인지, 최종 하차역인지 (현재 위치가 투영된 구간의 끝 포인트부터)
     next_subway_idx = None
-    for j in range(nearest_idx + 1, len(points)):
+    for j in range(projection.segment_index + 1, len(points)):
         if points[j].get("trafficType") == 1 and points[j].get("point_type") == "station":
             next_subway_idx = j
             break
@@ -548,8 +804,7 @@ async def _compute_track_state(lat: float, lng: float, route: dict) -> dict:
                 "message": "조만간 내려야 합니다.",
                 "stationName": pt.get("stationName"),
                 "arrival_minutes": None,
-                "nearest_index": nearest_idx,
-                "total_points": total_pts,
+                **position,
             }
         if pt.get("is_transfer"):
             return {
@@ -557,11 +812,10 @@ async def _compute_track_state(lat: float, lng: float, route: dict) -> dict:
                 "message": "조만간 환승해야 합니다.",
                 "stationName": pt.get("stationName"),
                 "arrival_minutes": None,
-                "nearest_index": nearest_idx,
-                "total_points": total_pts,
+                **position,
             }
 
-    return {"state": "ON_BOARD", "message": "이동 중입니다.", "stationName": None, "arrival_minutes": None, "nearest_index": nearest_idx, "total_points": total_pts}
+    return {"state": "ON_BOARD", "message": "이동 중입니다.", "stationName": None, "arrival_minutes": None, **position}
 
 
 class TTSRequest(BaseModel):
@@ -817,6 +1071,21 @@ async def health():
     return {
         "status": "healthy" if client else "no_azure_config",
         "azure_configured": bool(client),
+        "tts_cache": tts_cache.stats(),
+        "weather_cache": weather_cache.stats(),
+        "news_cache": news_cache.stats(),
+        "music_chart_cache": music_chart_cache.stats(),
+        "youtube_quota": youtube_quota.stats(),
+        "youtube_search_cache": youtube_search_cache.stats(),
+        "script_cache": script_cache.stats(),
+        "geocode_cache": geocode_cache.stats(),
+        "place_autocomplete_cache": place_autocomplete_cache.stats(),
+        "nav_route_cache": nav_route_cache.stats(),
+        "subway_arrival_cache": subway_arrival_cache.stats(),
+        "nav_route_sessions": nav_route_sessions.stats(),
+        "nav_track_push": station_refresher.stats(),
+        "singleflight": singleflight_stats(),
+        "prewarm": prewarm_scheduler.stats(),
     }
 
 
@@ -900,27 +1169,63 @@ async def consume_token(user_id: str = Depends(require_user_id)):
 
 
 KAKAO_KEYWORD_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
+KAKAO_KEYWORD_MAX_SIZE = 15  # 키워드 검색 한 페이지 최대 건수
 KAKAO_ADDRESS_URL = "https://dapi.kakao.com/v2/local/search/address.json"
 ODSAY_BASE = "https://api.odsay.com/v1/api"
 
 
+# 장소명 → 좌표 캐시. 값: (x, y), 찾을 수 없음은 () 로 저장 (네거티브 캐시)
+geocode_cache = AsyncTTLCache("geocode", max_entries=4096)
+geocode_store = MongoCacheStore("geocode_cache")
+
+
+def _normalize_place_query(query: str) -> str:
+    """캐시 키용 정규화: NFC, 공백 정리, 소문자"""
+    return " ".join(unicodedata.normalize("NFC", query or "").split()).lower()[:200]
+
+
+async def _geocode_kakao(q: str) -> tuple[tuple, bool]:
+    """Kakao 주소 검색 후 키워드 검색. ((x, y) 또는 (), 두 API 모두 정상 응답했는지)"""
+    headers = {"Authorization": f"KakaoAK {settings.kakao_rest_key}"}
+    client = http_clients.get("kakao")
+    definitive = True
+    for url in (KAKAO_ADDRESS_URL, KAKAO_KEYWORD_URL):
+        r = await client.get(url, headers=headers, params={"query": q})
+        if r.status_code != 200:
+            definitive = False
+            continue
+        data = r.json()
+        docs = data.get("documents") or []
+        if docs:
+            d = docs[0]
+            return (float(d["x"]), float(d["y"])), True
+    return (), definitive
+
+
+@single_flight("geocode", key=lambda query: _normalize_place_query(query))
 async def geocode_place(query: str) -> tuple[float, float]:
-    """장소명/주소 → (경도 x, 위도 y). Kakao 주소 검색 후 키워드 검색."""
+    """
+    장소명/주소 → (경도 x, 위도 y). 메모리 → MongoDB → Kakao 순.
+    Kakao가 정상 응답했는데 결과가 없으면 "찾을 수 없음"도 캐시 (오류 응답은 캐시하지 않음).
+    """
     if not settings.kakao_rest_key or not query or not query.strip():
         raise ValueError("장소를 찾을 수 없습니다.")
-    q = query.strip()[:200]
-    headers = {"Authorization": f"KakaoAK {settings.kakao_rest_key}"}
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        for url in (KAKAO_ADDRESS_URL, KAKAO_KEYWORD_URL):
-            r = await client.get(url, headers=headers, params={"query": q})
-            if r.status_code != 200:
-                continue
-            data = r.json()
-            docs = data.get("documents") or []
-            if docs:
-                d = docs[0]
-                return float(d["x"]), float(d["y"])
-    raise ValueError(f"좌표를 찾을 수 없음: {query}")
+    key = _normalize_place_query(query)
+    coords = geocode_cache.get(key)
+    if coords is None:
+        stored = await geocode_store.get(key)
+        if stored is not None and stored[1]:
+            coords = tuple(stored[0] or ())
+        else:
+            coords, definitive = await _geocode_kakao(query.strip()[:200])
+            if not coords and not definitive:
+                raise ValueError(f"좌표를 찾을 수 없음: {query}")
+            ttl = settings.geocode_cache_ttl if coords else settings.geocode_negative_ttl
+            await geocode_store.set(key, list(coords), ttl=ttl)
+        geocode_cache.set(key, coords, ttl=settings.geocode_cache_ttl if coords else settings.geocode_negative_ttl)
+    if not coords:
+        raise ValueError(f"좌표를 찾을 수 없음: {query}")
+    return coords
 
 
 def _extract_nav_summary(best_path: dict) -> dict:
@@ -1015,35 +1320,39 @@ def _filter_arrivals_by_direction(arrivals: list, route_info: dict) -> list:
     return filtered
 
 
-async def _get_realtime_subway_arrival(station_name: str) -> list:
-    """서울시 지하철 실시간 도착정보 (역명)."""
+# 역별 실시간 도착정보 공유 캐시 (짧은 TTL). 같은 역 동시 미스는 조회 1회로 합침
+subway_arrival_cache = AsyncTTLCache("subway_arrival", max_entries=1024, default_ttl=settings.subway_arrival_cache_ttl)
+
+
+async def _fetch_subway_arrival(final_name: str) -> list[SubwayArrival]:
+    """서울시 지하철 실시간 도착정보 조회. 도착정보 없음(INFO-000 외 코드)은 빈 리스트, 통신 오류는 예외."""
+    fmt = "xml" if settings.seoul_subway_format == "xml" else "json"
+    url = f"{SEOUL_SUBWAY_API_BASE}/{settings.seoul_subway_api_key}/{fmt}/realtimeStationArrival/0/10/{quote(final_name)}"
+    r = await http_clients.get("subway").get(url)
+    if r.status_code != 200:
+        raise RuntimeError(f"status={r.status_code}")
+    return parse_arrivals_xml(r.content) if fmt == "xml" else parse_arrivals_json(r.content)
+
+
+async def _get_realtime_subway_arrival(station_name: str, refresh: bool = False) -> list:
+    """
+    서울시 지하철 실시간 도착정보 (역명). 역별 캐시 공유, 오류 시 빈 리스트 (오류는 캐시하지 않음).
+    refresh=True: 캐시를 무시하고 새로 조회 (역별 갱신 타이머용)
+    """
     if not settings.seoul_subway_api_key:
         return []
-    cleaned = station_name.replace("역", "").strip()
+    cleaned = station_name.strip()
+    # 끝의 "역"만 제거 (역삼·역촌처럼 이름에 들어간 "역"은 유지)
+    if len(cleaned) > 1 and cleaned.endswith("역"):
+        cleaned = cleaned[:-1]
     name_map = {"천호": "천호(풍납토성)"}
     final_name = name_map.get(cleaned, cleaned)
-    url = f"{SEOUL_SUBWAY_API_BASE}/{settings.seoul_subway_api_key}/xml/realtimeStationArrival/0/10/{quote(final_name)}"
+    if not final_name:
+        return []
+    if refresh:
+        subway_arrival_cache.invalidate(final_name)
     try:
-        async with httpx.AsyncClient(timeout=8.0) as client:
-            r = await client.get(url)
-        r.encoding = "utf-8"
-        if r.status_code != 200:
-            return []
-        root = ET.fromstring(r.content)
-        code_el = root.find(".//code")
-        if code_el is not None and (code_el.text or "") != "INFO-000":
-            return []
-        out = []
-        for row in root.findall(".//row"):
-            info = {c.tag: c.text for c in row}
-            out.append({
-                "subwayId": info.get("subwayId", ""),
-                "trainLineNm": info.get("trainLineNm", ""),
-                "barvlDt": info.get("barvlDt", ""),
-                "arvlMsg2": info.get("arvlMsg2", ""),
-                "bstatnNm": info.get("bstatnNm", ""),
-            })
-        return out
+        return await subway_arrival_cache.get_or_load(final_name, lambda: _fetch_subway_arrival(final_name))
     except Exception as e:
         logger.warning("지하철 실시간 조회 예외 %s: %s", station_name, e)
         return []
@@ -1079,29 +1388,66 @@ def _build_subway_route_info(legs: list) -> list:
     return infos
 
 
-async def fetch_nav_route(start_query: str, end_query: str, opt: int = 0) -> dict:
-    """출발지·도착지 → 대중교통 경로 (ODsay)."""
-    if not settings.odsay_api_key:
-        raise ValueError("ODSAY_API_KEY가 설정되지 않았습니다.")
-    sx, sy = await geocode_place(start_query)
-    ex, ey = await geocode_place(end_query)
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        r = await client.get(
-            f"{ODSAY_BASE}/searchPubTransPathT",
-            params={"SX": sx, "SY": sy, "EX": ex, "EY": ey, "OPT": opt, "apiKey": settings.odsay_api_key},
-        )
+@single_flight("odsay_path")
+async def _search_odsay_best_path(sx: float, sy: float, ex: float, ey: float, opt: int) -> dict:
+    """ODsay 대중교통 경로 검색 → 첫 번째(추천) 경로"""
+    r = await http_clients.get("odsay").get(
+        f"{ODSAY_BASE}/searchPubTransPathT",
+        params={"SX": sx, "SY": sy, "EX": ex, "EY": ey, "OPT": opt, "apiKey": settings.odsay_api_key},
+    )
     r.raise_for_status()
     data = r.json()
     if "result" not in data or not (data["result"].get("path")):
         raise RuntimeError("경로를 찾을 수 없습니다.")
-    best = data["result"]["path"][0]
-    summary = _extract_nav_summary(best)
-    legs = _extract_nav_legs(best)
+    return data["result"]["path"][0]
+
+
+# ODsay 경로 캐시: summary·legs만 저장 (실시간 도착정보는 매 요청 새로 붙임)
+nav_route_cache = AsyncTTLCache("nav_route", max_entries=1024)
+nav_route_store = MongoCacheStore("nav_route_cache")
+
+
+def _nav_route_cache_key(sx: float, sy: float, ex: float, ey: float, opt: int, now: Optional[float] = None) -> str:
+    """스냅 좌표 + opt + 요일 유형(평일/토/일) + KST 시간대 구간. 배차·급행 운행이 요일·시간대별로 달라 구분."""
+    step = settings.nav_route_snap_deg
+    snap = lambda v: f"{round(v / step) * step:.5f}"
+    kst = time.gmtime((time.time() if now is None else now) + 9 * 3600)
+    day_type = "sat" if kst.tm_wday == 5 else "sun" if kst.tm_wday == 6 else "wd"
+    bucket = (kst.tm_hour * 60 + kst.tm_min) // max(1, settings.nav_route_time_bucket_minutes)
+    return f"{snap(sx)},{snap(sy)}>{snap(ex)},{snap(ey)}|{opt}|{day_type}|{bucket}"
+
+
+async def _get_nav_route_plan(sx: float, sy: float, ex: float, ey: float, opt: int) -> dict:
+    """{"summary", "legs"} - 메모리 → MongoDB → ODsay 순. 같은 키 동시 미스는 ODsay 1회."""
+    key = _nav_route_cache_key(sx, sy, ex, ey, opt)
+
+    async def load() -> dict:
+        stored = await nav_route_store.get(key)
+        if stored is not None and stored[1]:
+            return stored[0]
+        best = await _search_odsay_best_path(sx, sy, ex, ey, opt)
+        plan = {"summary": _extract_nav_summary(best), "legs": _extract_nav_legs(best)}
+        await nav_route_store.set(key, plan, ttl=settings.nav_route_cache_ttl)
+        return plan
+
+    return await nav_route_cache.get_or_load(key, load, ttl=settings.nav_route_cache_ttl)
+
+
+async def fetch_nav_route(start_query: str, end_query: str, opt: int = 0) -> dict:
+    """출발지·도착지 → 대중교통 경로 (ODsay, 캐시) + 실시간 지하철 도착정보."""
+    if not settings.odsay_api_key:
+        raise ValueError("ODSAY_API_KEY가 설정되지 않았습니다.")
+    (sx, sy), (ex, ey) = await asyncio.gather(geocode_place(start_query), geocode_place(end_query))
+    # 캐시 값이 응답 처리 중 바뀌지 않도록 복사본 사용
+    plan = copy.deepcopy(await _get_nav_route_plan(sx, sy, ex, ey, opt))
+    summary = plan["summary"]
+    legs = plan["legs"]
     realtime_subway = {}
     subway_infos = _build_subway_route_info(legs)
-    for route_info in subway_infos:
+    # 출발역·환승역 도착정보를 동시에 조회 (환승 횟수만큼 지연이 늘지 않도록)
+    all_arrivals = await asyncio.gather(*(_get_realtime_subway_arrival(info["station"]) for info in subway_infos))
+    for route_info, arrivals in zip(subway_infos, all_arrivals):
         station = route_info["station"]
-        arrivals = await _get_realtime_subway_arrival(station)
         if arrivals:
             filtered = _filter_arrivals_by_direction(arrivals, route_info)
             if filtered:
@@ -1119,42 +1465,104 @@ async def fetch_nav_route(start_query: str, end_query: str, opt: int = 0) -> dic
     }
 
 
+def _compact(text: str) -> str:
+    return "".join((text or "").split()).lower()
+
+
+def _place_matches(place: dict, key: str) -> bool:
+    """짧은 검색어의 완전한 결과에서 더 긴 검색어에 맞는 장소만 남길 때 사용 (공백 무시 부분 일치)"""
+    q = _compact(key)
+    return q in _compact(place.get("name", "")) or q in _compact(place.get("address", ""))
+
+
+place_autocomplete_cache = PrefixCache(
+    "place_autocomplete",
+    match=_place_matches,
+    max_entries=settings.place_autocomplete_cache_max_entries,
+    ttl=settings.place_autocomplete_cache_ttl,
+)
+
+
+async def _kakao_place_search(query: str) -> tuple[list, bool]:
+    """
+    Kakao 키워드 검색 첫 페이지(최대 15건) → (결과, 전체 결과를 다 받았는지). 실패 시 예외.
+    응답 건수(limit)보다 많이 받아 두어야 더 긴 접두어를 캐시로 답할 수 있는 '완전한' 결과가 자주 생김.
+    """
+    # 자동완성은 타이핑 중 호출되므로 공유 Kakao 클라이언트보다 짧은 타임아웃 사용
+    r = await http_clients.get("kakao").get(
+        KAKAO_KEYWORD_URL,
+        headers={"Authorization": f"KakaoAK {settings.kakao_rest_key}"},
+        params={"query": query[:100], "size": KAKAO_KEYWORD_MAX_SIZE},
+        timeout=5.0,
+    )
+    if r.status_code != 200:
+        raise RuntimeError(f"Kakao 자동완성 실패: status={r.status_code}")
+    data = r.json()
+    docs = (data.get("documents") or [])[:KAKAO_KEYWORD_MAX_SIZE]
+    results = []
+    for doc in docs:
+        results.append({
+            "name": doc.get("place_name", ""),
+            "address": doc.get("road_address_name") or doc.get("address_name", ""),
+            "category": doc.get("category_group_name", ""),
+            "x": doc.get("x", ""),
+            "y": doc.get("y", ""),
+        })
+    meta = data.get("meta") or {}
+    total = meta.get("total_count")
+    complete = meta.get("is_end") is True or (isinstance(total, int) and total <= len(docs))
+    return results, complete
+
+
+@single_flight("place_autocomplete", key=lambda query, limit=5: (_normalize_place_query(query), limit))
 async def fetch_place_autocomplete(query: str, limit: int = 5) -> list:
-    """Kakao 키워드 검색으로 장소 자동완성 결과 반환. 키 없으면 빈 리스트."""
+    """
+    Kakao 키워드 검색으로 장소 자동완성 결과 반환. 키 없으면 빈 리스트.
+    같은 검색어 또는 완전한 결과가 있는 더 짧은 접두어가 캐시에 있으면 Kakao를 부르지 않음.
+    """
     if not settings.kakao_rest_key or not query or not query.strip():
         return []
+    key = _normalize_place_query(query)
+    cached = place_autocomplete_cache.get(key, limit)
+    if cached is not None:
+        return cached
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            r = await client.get(
-                KAKAO_KEYWORD_URL,
-                headers={"Authorization": f"KakaoAK {settings.kakao_rest_key}"},
-                params={"query": query.strip()[:100], "size": limit},
-            )
-        if r.status_code != 200:
-            logger.warning("Kakao 자동완성 실패: status=%s", r.status_code)
-            return []
-        data = r.json()
-        results = []
-        for doc in (data.get("documents") or [])[:limit]:
-            results.append({
-                "name": doc.get("place_name", ""),
-                "address": doc.get("road_address_name") or doc.get("address_name", ""),
-                "category": doc.get("category_group_name", ""),
-                "x": doc.get("x", ""),
-                "y": doc.get("y", ""),
-            })
-        return results
+        results, complete = await _kakao_place_search(query.strip())
     except Exception as e:
-        logger.exception("장소 자동완성 예외: %s", e)
+        logger.warning("장소 자동완성 예외: %s", e)
         return []
+    # 받은 페이지 전체를 캐시 (더 긴 접두어 필터용), 응답은 limit건
+    place_autocomplete_cache.set(key, results, complete)
+    return results[:limit]
+
+
+# 자동완성 세션별 최신 요청 (새 요청이 오면 이전 요청은 응답을 기다리지 않고 바로 종료)
+_autocomplete_latest: dict[str, asyncio.Event] = {}
 
 
 @app.get("/place/autocomplete")
-async def place_autocomplete(q: str = Query("", description="검색어")):
+async def place_autocomplete(
+    q: str = Query("", description="검색어"),
+    session: Optional[str] = Query(None, max_length=64, description="입력창별 임의 ID. 같은 세션의 새 요청이 오면 이전 요청은 superseded로 종료"),
+):
     """장소 자동완성 (Kakao 로컬 API). 설정 화면 집/회사 위치 입력용."""
+    superseded = None
+    if session:
+        previous = _autocomplete_latest.get(session)
+        if previous is not None:
+            previous.set()
+        superseded = _autocomplete_latest[session] = asyncio.Event()
     try:
-        results = await fetch_place_autocomplete(q, limit=5)
-        return {"results": results}
+        if superseded is None:
+            return {"results": await fetch_place_autocomplete(q, limit=5)}
+        # Kakao 호출은 계속 진행해 캐시를 채우고, 이 요청만 먼저 끝냄
+        fetch_task = asyncio.ensure_future(fetch_place_autocomplete(q, limit=5))
+        wait_task = asyncio.ensure_future(superseded.wait())
+        await asyncio.wait({fetch_task, wait_task}, return_when=asyncio.FIRST_COMPLETED)
+        wait_task.cancel()
+        if not fetch_task.done():
+            return {"results": [], "superseded": True}
+        return {"results": fetch_task.result()}
     except Exception as e:
         logger.exception("place/autocomplete 예외: %s", e)
         return JSONResponse(
@@ -1162,6 +1570,9 @@ async def place_autocomplete(q: str = Query("", description="검색어")):
             content={"detail": str(e), "results": []},
             headers={"Access-Control-Allow-Origin": "*"},
         )
+    finally:
+        if session and _autocomplete_latest.get(session) is superseded:
+            del _autocomplete_latest[session]
 
 
 @app.post("/nav/route")
@@ -1169,6 +1580,7 @@ async def nav_route(request: NavRouteRequest):
     """대중교통 경로 검색 (출발지=집 주소, 도착지=회사 위치). ODsay API."""
     try:
         result = await fetch_nav_route(request.start.strip(), request.end.strip(), request.opt)
+        result["route_id"] = await register_route_session(result)
         return result
     except ValueError as e:
         return JSONResponse(
@@ -1187,8 +1599,31 @@ async def nav_route(request: NavRouteRequest):
 
 @app.post("/nav/track")
 async def nav_track(request: TrackPositionRequest):
-    """실시간 GPS 기반 경로 추적: 탑승 전(열차 도착 N분) / 탑승 중(환승·하차 알림)."""
+    """
+    실시간 GPS 기반 경로 추적: 탑승 전(열차 도착 N분) / 탑승 중(환승·하차 알림).
+    {route_id, lat, lng} 권장 (경로 재전송·재파싱 없음). route 전체를 보내는 기존 방식도 지원.
+    route_id가 만료됐고 route도 없으면 404 route_expired → 클라이언트가 /nav/route 재호출.
+    """
     try:
+        compiled = await get_route_session(request.route_id) if request.route_id else None
+        if compiled is not None:
+            tracker = None
+            if request.tracker_id:
+                tracker_key = (request.route_id, request.tracker_id[:64])
+                tracker = nav_trackers.get(tracker_key) or _new_tracker(compiled)
+                nav_trackers.set(tracker_key, tracker)
+            return await _compute_track_state(
+                request.lat, request.lng, compiled["route"], compiled["points"], compiled["geometry"], tracker
+            )
+        if request.route is None:
+            return JSONResponse(
+                status_code=404 if request.route_id else 400,
+                content={
+                    "detail": "경로 세션이 만료되었습니다. 경로를 다시 조회해 주세요." if request.route_id else "route_id 또는 route가 필요합니다.",
+                    "error": "route_expired" if request.route_id else "nav_track_error",
+                },
+                headers={"Access-Control-Allow-Origin": "*"},
+            )
         route_dict = request.route.model_dump()
         result = await _compute_track_state(request.lat, request.lng, route_dict)
         return result
@@ -1210,6 +1645,137 @@ async def nav_track(request: TrackPositionRequest):
         )
 
 
+@app.post("/nav/track/batch")
+async def nav_track_batch(request: TrackBatchRequest):
+    """
+    기록된 GPS 좌표열을 한 번에 재생해 상태 목록 반환 (회귀 테스트·분석 백필용).
+    - states: 좌표별 상태 (/nav/track 응답 + t)
+    - transitions: 상태·문구·역·도착 분·위치가 바뀐 좌표 인덱스 (푸시 채널이 보낼 시점과 동일)
+    """
+    try:
+        if request.route_id:
+            compiled = await get_route_session(request.route_id)
+            if compiled is None:
+                return JSONResponse(
+                    status_code=404,
+                    content={"detail": "경로 세션이 만료되었습니다. 경로를 다시 조회해 주세요.", "error": "route_expired"},
+                    headers={"Access-Control-Allow-Origin": "*"},
+                )
+        elif request.route is not None:
+            compiled = _compile_route(request.route.model_dump())
+        else:
+            return JSONResponse(
+                status_code=400,
+                content={"detail": "route_id 또는 route가 필요합니다.", "error": "nav_track_batch_error"},
+                headers={"Access-Control-Allow-Origin": "*"},
+            )
+
+        stub = request.stub_arrivals or {}
+
+        async def _stub_lookup(station: str) -> list:
+            return stub.get(station) or stub.get(f"{station}역") or []
+
+        arrivals_lookup = _stub_lookup if not request.realtime else None
+        tracker = _new_tracker(compiled) if request.incremental else None
+        states = []
+        transitions = []
+        last_key = None
+        for i, fix in enumerate(request.fixes):
+            state = await _compute_track_state(
+                fix.lat, fix.lng, compiled["route"], compiled["points"], compiled["geometry"], tracker, arrivals_lookup
+            )
+            key = tuple(state.get(k) for k in _TRACK_PUSH_FIELDS)
+            if key != last_key:
+                transitions.append(i)
+                last_key = key
+            states.append({"t": fix.t, **state})
+        return {"count": len(states), "states": states, "transitions": transitions}
+    except Exception as e:
+        logger.exception("nav/track/batch 예외: %s", e)
+        return JSONResponse(
+            status_code=500,
+            content={"detail": str(e), "error": "nav_track_batch_error"},
+            headers={"Access-Control-Allow-Origin": "*"},
+        )
+
+
+# 추적 푸시 채널에서 구독 중인 역만 주기적으로 갱신 (역당 타이머 1개)
+station_refresher = StationRefresher(
+    lambda station: _get_realtime_subway_arrival(station, refresh=True),
+    interval=settings.nav_track_push_interval,
+)
+
+# 이 필드가 바뀔 때만 푸시 (progress는 매 좌표마다 바뀌므로 제외)
+_TRACK_PUSH_FIELDS = ("state", "message", "stationName", "arrival_minutes", "nearest_index", "segment_index")
+
+
+@app.websocket("/nav/track/ws")
+async def nav_track_ws(websocket: WebSocket, route_id: str = Query(..., description="/nav/route 응답의 route_id")):
+    """
+    실시간 경로 추적 푸시 채널.
+    - 클라이언트 → 서버: {"lat": .., "lng": ..} (GPS 좌표가 바뀔 때마다)
+    - 서버 → 클라이언트: {"type": "state", ...} (/nav/track 응답과 같은 필드, 상태가 바뀔 때만)
+      탑승 전에는 첫 역 도착정보를 역별 공유 타이머로 갱신해 도착 분이 바뀌면 좌표 없이도 푸시
+    - 경로 세션이 없으면 {"type": "error", "error": "route_expired"} 후 종료 (코드 4404)
+    """
+    await websocket.accept()
+    compiled = await get_route_session(route_id)
+    if compiled is None:
+        await websocket.send_json({"type": "error", "error": "route_expired", "detail": "경로 세션이 만료되었습니다."})
+        await websocket.close(code=4404)
+        return
+
+    wake = asyncio.Event()
+    fix: dict = {}
+    tracker = _new_tracker(compiled)
+
+    async def receive_fixes():
+        while True:
+            msg = await websocket.receive_json()
+            try:
+                fix["lat"], fix["lng"] = float(msg["lat"]), float(msg["lng"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            wake.set()
+
+    receiver = asyncio.create_task(receive_fixes())
+    watched_station: Optional[str] = None
+    unsubscribe = None
+    last_sent = None
+    try:
+        while True:
+            waiter = asyncio.create_task(wake.wait())
+            await asyncio.wait({receiver, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            waiter.cancel()
+            if receiver.done():
+                break
+            wake.clear()
+            if not fix:
+                continue
+            state = await _compute_track_state(
+                fix["lat"], fix["lng"], compiled["route"], compiled["points"], compiled["geometry"], tracker
+            )
+            key = tuple(state.get(k) for k in _TRACK_PUSH_FIELDS)
+            if key != last_sent:
+                await websocket.send_json({"type": "state", **state})
+                last_sent = key
+            station = state.get("stationName") if state.get("state") == "BEFORE_BOARDING" else None
+            if station != watched_station:
+                if unsubscribe is not None:
+                    unsubscribe()
+                unsubscribe = station_refresher.subscribe(station, wake.set) if station else None
+                watched_station = station
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.exception("nav/track/ws 예외: %s", e)
+    finally:
+        receiver.cancel()
+        await asyncio.gather(receiver, return_exceptions=True)
+        if unsubscribe is not None:
+            unsubscribe()
+
+
 @app.get("/weather")
 async def weather(
     lat: float = Query(37.5665, description="위도"),
@@ -1233,12 +1799,52 @@ async def weather(
         )
 
 
+# Deezer 차트 (정규화된 목록 + ETag/Last-Modified)
+music_chart_cache = AsyncTTLCache("music_chart", max_entries=4)
+
+
+async def _load_music_chart() -> dict:
+    tracks = await fetch_deezer_chart()
+    body = json.dumps(tracks, ensure_ascii=False, sort_keys=True)
+    etag = '"' + hashlib.sha1(body.encode("utf-8")).hexdigest() + '"'
+    # 차트 내용이 그대로면 Last-Modified 유지 (If-Modified-Since 재검증이 계속 304가 되도록)
+    previous = music_chart_cache.peek("top50")
+    last_modified = previous["last_modified"] if previous and previous["etag"] == etag else time.time()
+    return {"tracks": tracks, "etag": etag, "last_modified": last_modified}
+
+
+def _chart_not_modified(request: Request, etag: str, last_modified: float) -> bool:
+    """If-None-Match / If-Modified-Since 조건부 요청 판정"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        return etag in [t.strip() for t in if_none_match.split(",")] or if_none_match.strip() == "*"
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
 @app.get("/music/chart")
-async def music_chart():
-    """Deezer 인기 차트 (트랙 목록, 미리듣기 URL 포함)."""
+async def music_chart(request: Request):
+    """Deezer 인기 차트 (트랙 목록, 미리듣기 URL 포함). 메모리 캐시 + ETag 재검증."""
     try:
-        tracks = await fetch_deezer_chart()
-        return {"tracks": tracks}
+        chart = await music_chart_cache.get_or_load(
+            "top50",
+            _load_music_chart,
+            ttl=settings.music_chart_ttl,
+            stale_ttl=settings.music_chart_stale_ttl,
+        )
+        headers = {
+            "ETag": chart["etag"],
+            "Last-Modified": formatdate(chart["last_modified"], usegmt=True),
+            "Cache-Control": "no-cache",
+        }
+        if _chart_not_modified(request, chart["etag"], chart["last_modified"]):
+            return Response(status_code=304, headers=headers)
+        return JSONResponse({"tracks": chart["tracks"]}, headers=headers)
     except Exception as e:
         logger.exception("음악 차트 조회 실패: %s", e)
         return JSONResponse(
@@ -1270,7 +1876,12 @@ async def music_search(
                         "Access-Control-Allow-Headers": "*",
                     },
                 )
-            videos = await fetch_youtube_search(q)
+            try:
+                videos = await fetch_youtube_search(q)
+            except YouTubeQuotaExceeded as e:
+                # 쿼터 부족: 403 대신 Deezer 검색 결과로 대체
+                logger.warning("YouTube 쿼터 부족, Deezer로 대체: q=%s (%s)", q, e)
+                return {"source": "deezer", "degraded": True, "videos": [], "tracks": await fetch_deezer_search(q)}
             if not videos:
                 logger.warning(f"YouTube 검색 결과 없음: q={q}")
             return {"source": "youtube", "videos": videos}
@@ -1329,17 +1940,14 @@ async def music_search(
 
 
 async def fetch_news_per_sections(sections: list[str], per_section: int = 1) -> list:
-    """여러 섹션에서 각각 per_section건씩 가져와 합친 리스트 반환."""
+    """여러 섹션에서 각각 per_section건씩 동시에 가져와 섹션 순서대로 합친 리스트 반환."""
     if not sections:
         return await fetch_news(section="all", page_size=3)
+    secs = [s.strip() for s in sections if s and s.strip()]
+    results = await asyncio.gather(*(fetch_news(section=sec, page_size=per_section) for sec in secs))
     out = []
-    for sec in sections:
-        sec = (sec or "").strip()
-        if not sec:
-            continue
-        items = await fetch_news(section=sec, page_size=per_section)
-        for a in items[:per_section]:
-            out.append(a)
+    for items in results:
+        out.extend(items[:per_section])
     return out
 
 
@@ -1365,8 +1973,243 @@ async def radio_script_ready():
     return {"ok": True, "message": "서버 응답 정상. Azure 설정 여부는 GET /health 로 확인하세요."}
 
 
+SCRIPT_TEMPERATURE = 0.8
+
+# 프롬프트가 같으면 결과를 공유하는 대본 캐시 (현재 뉴스 멘트만 사용; 인사말·마무리말은 사용자별 입력이 섞여 제외)
+script_cache = AsyncTTLCache("llm_scripts", max_entries=settings.script_cache_max_entries, default_ttl=settings.script_cache_ttl)
+script_store = MongoCacheStore("llm_script_cache")
+
+
+async def _complete_script(system: str, user: str, max_tokens: int) -> str:
+    """시스템/사용자 프롬프트로 대본 1건 생성 (Azure OpenAI)"""
+    resp = await azure_openai.chat_completion(
+        model=settings.model_name,
+        messages=[
+            {"role": "system", "content": system},
+            {"role": "user", "content": user},
+        ],
+        max_tokens=max_tokens,
+        temperature=SCRIPT_TEMPERATURE,
+        top_p=settings.top_p,
+    )
+    return (resp.choices[0].message.content or "").strip()
+
+
+def _script_cache_key(system: str, user: str, max_tokens: int) -> str:
+    """프롬프트 + 모델·샘플링 설정 해시 (설정이 바뀌면 자동으로 다른 키)"""
+    raw = json.dumps(
+        {
+            "model": settings.model_name,
+            "temperature": SCRIPT_TEMPERATURE,
+            "top_p": settings.top_p,
+            "max_tokens": max_tokens,
+            "system": system,
+            "user": user,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+async def _store_script(key: str, content: str):
+    script_cache.set(key, content, ttl=settings.script_cache_ttl)
+    await script_store.set(key, content, ttl=settings.script_cache_ttl)
+
+
+async def _complete_script_cached(system: str, user: str, max_tokens: int) -> str:
+    """
+    메모리 → MongoDB → Azure OpenAI 순. 같은 프롬프트 동시 미스는 LLM 호출 1회로 합침.
+    빈 응답은 캐시하지 않음.
+    """
+    key = _script_cache_key(system, user, max_tokens)
+
+    async def load() -> str:
+        stored = await script_store.get(key)
+        if stored is not None and stored[1] and stored[0]:
+            return stored[0]
+        content = await _complete_script(system, user, max_tokens)
+        if content:
+            await script_store.set(key, content, ttl=settings.script_cache_ttl)
+        return content
+
+    content = await script_cache.get_or_load(key, load, ttl=settings.script_cache_ttl)
+    if not content:
+        script_cache.invalidate(key)
+    return content
+
+
+async def _generate_greeting_script(
+    weather_text: str, user_name: Optional[str] = None, dj_name: Optional[str] = None
+) -> str:
+    """인사말 대본 생성"""
+    system, user = _build_greeting_prompt(weather_text, user_name, dj_name)
+    return await _complete_script(system, user, max_tokens=min(settings.max_tokens, 800))
+
+
+def _news_items_from_articles(articles: list) -> list[dict]:
+    """기사(dict 또는 NewsItemForScript) → 멘트 프롬프트용 뉴스 항목. 모든 경로가 같은 정규화를 써야 스크립트 캐시 키가 일치"""
+    items = []
+    for a in articles:
+        title, summary = (a.get("title"), a.get("summary")) if isinstance(a, dict) else (a.title, a.summary)
+        items.append({"title": (title or "")[:200], "summary": (summary or "")[:3000]})
+    return items
+
+
+async def _generate_news_segments(
+    news_items: list[dict], dj_name: Optional[str] = None, use_cache: bool = True
+) -> list[str]:
+    """뉴스 N건 → 멘트 N개 (뉴스 없으면 안내 멘트 1개). use_cache=False면 항상 새로 생성."""
+    if not news_items:
+        return ["오늘은 전해드릴 뉴스가 없습니다."]
+    system, user = _build_news_segments_prompt(news_items, dj_name)
+    max_tokens = min(settings.max_tokens, 1200)
+    if use_cache and settings.script_cache_enabled:
+        content = await _complete_script_cached(system, user, max_tokens)
+    else:
+        content = await _complete_script(system, user, max_tokens)
+    return _split_news_segments(content, len(news_items))
+
+
+# --- 스크립트 스트리밍 (SSE) ---
+NEWS_SEGMENT_SEPARATOR = "---NEXT---"
+
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # nginx 프록시 버퍼링 끄기 (토큰 즉시 전달)
+    "Access-Control-Allow-Origin": "*",
+}
+
+
+def _sse_event(event: str, data: dict) -> str:
+    """SSE 이벤트 한 건 (data는 JSON)"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _split_news_segments(content: str, n: int) -> list[str]:
+    """---NEXT--- 로 구분된 LLM 출력 → 멘트 n개 (부족하면 기본 문구로 채움)"""
+    parts = [p.strip() for p in content.split(NEWS_SEGMENT_SEPARATOR) if p.strip()]
+    if len(parts) >= n:
+        return parts[:n]
+    if len(parts) >= 1:
+        return parts + ["이상 오늘의 뉴스였습니다."] * (n - len(parts))
+    return ["오늘의 뉴스를 간단히 전해드렸습니다."] * n
+
+
+def _sse_script_response(
+    system: str, user: str, max_tokens: int, segments: Optional[int] = None, use_cache: bool = False
+) -> StreamingResponse:
+    """
+    스크립트 생성 결과를 SSE로 스트리밍.
+    - event: token   {"delta": "..."}  (토큰 조각)
+    - event: segment {"index": i, "script": "..."}  (segments 지정 시, ---NEXT--- 파싱될 때마다)
+    - event: done    {"script": "..."} 또는 {"scripts": [...]}  (비스트리밍 응답과 동일)
+    - event: error   {"detail": "...", "error": "script_stream_failed"}
+    use_cache=True: 대본 캐시(메모리 → MongoDB)에 있으면 전체를 token 1건으로 바로 내보내고, 없으면 스트리밍 후 저장.
+    같은 프롬프트가 이미 생성 중이면 새로 스트리밍하지 않고 그 결과를 기다렸다가 token 1건으로 내보냄.
+    """
+    cache_key = _script_cache_key(system, user, max_tokens) if use_cache and settings.script_cache_enabled else None
+
+    def llm_deltas():
+        return azure_openai.stream_chat_completion(
+            model=settings.model_name,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            max_tokens=max_tokens,
+            temperature=SCRIPT_TEMPERATURE,
+            top_p=settings.top_p,
+        )
+
+    async def deltas():
+        if cache_key is None:
+            async for delta in llm_deltas():
+                yield delta
+            return
+        cached = script_cache.get(cache_key)
+        if cached:
+            yield cached
+            return
+        if cache_key not in script_cache._flight:
+            stored = await script_store.get(cache_key)
+            if stored is not None and stored[1] and stored[0]:
+                script_cache.set(cache_key, stored[0], ttl=settings.script_cache_ttl)
+                yield stored[0]
+                return
+        # 같은 프롬프트 동시 요청(스트리밍·비스트리밍)은 LLM 호출 1회.
+        # 직접 생성하면 토큰을 그대로 중계하고, 다른 요청의 생성에 합류했으면 완료 후 전체를 1건으로 내보냄
+        queue: asyncio.Queue = asyncio.Queue()
+        started = False
+
+        async def produce() -> str:
+            nonlocal started
+            started = True
+            chunks: list[str] = []
+            try:
+                async for delta in llm_deltas():
+                    chunks.append(delta)
+                    queue.put_nowait(delta)
+            finally:
+                queue.put_nowait(None)
+            content = "".join(chunks).strip()
+            if content:
+                await _store_script(cache_key, content)
+            return content
+
+        flight = asyncio.ensure_future(script_cache._flight.do(cache_key, produce))
+        flight.add_done_callback(lambda t: t.cancelled() or t.exception())
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait({getter, flight}, return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                getter.cancel()
+                break
+            delta = getter.result()
+            if delta is None:
+                break
+            yield delta
+        content = await flight
+        if not started and content:
+            yield content
+
+    async def event_stream():
+        chunks: list[str] = []
+        pending = ""
+        emitted = 0
+        try:
+            async for delta in deltas():
+                chunks.append(delta)
+                yield _sse_event("token", {"delta": delta})
+                if segments is None:
+                    continue
+                pending += delta
+                while NEWS_SEGMENT_SEPARATOR in pending:
+                    part, pending = pending.split(NEWS_SEGMENT_SEPARATOR, 1)
+                    if part.strip() and emitted < segments:
+                        yield _sse_event("segment", {"index": emitted, "script": part.strip()})
+                        emitted += 1
+            content = "".join(chunks).strip()
+            if segments is None:
+                yield _sse_event("done", {"script": content})
+                return
+            scripts = _split_news_segments(content, segments)
+            # 마지막 멘트(구분자 뒤) 또는 부족분 채움 문구
+            for i in range(emitted, len(scripts)):
+                yield _sse_event("segment", {"index": i, "script": scripts[i]})
+            yield _sse_event("done", {"scripts": scripts})
+        except Exception as e:
+            logger.exception("스크립트 스트리밍 중 예외: %s", e)
+            yield _sse_event("error", {"detail": str(e), "error": "script_stream_failed"})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=_SSE_HEADERS)
+
+
 @app.post("/radio-script/greeting")
-async def create_greeting_script(request: GreetingScriptRequest):
+async def create_greeting_script(
+    request: GreetingScriptRequest,
+    stream: bool = Query(False, description="true면 SSE로 토큰 스트리밍"),
+):
     """인사말 스크립트 생성 (날씨 포함). 자연스럽게 뉴스로 이어질 수 있도록 작성."""
     try:
         client = get_azure_client()
@@ -1397,19 +2240,11 @@ async def create_greeting_script(request: GreetingScriptRequest):
         logger.info("인사말 스크립트 프롬프트 생성 중...")
         system, user = _build_greeting_prompt(weather_text, request.user_name, request.dj_name)
         logger.info(f"프롬프트 생성 완료 (시스템: {len(system)}자, 사용자: {len(user)}자)")
+        if stream:
+            return _sse_script_response(system, user, max_tokens=min(settings.max_tokens, 800))
         
         logger.info(f"Azure OpenAI API 호출 중... (모델: {settings.model_name})")
-        resp = client.chat.completions.create(
-            model=settings.model_name,
-            messages=[
-                {"role": "system", "content": system},
-                {"role": "user", "content": user},
-            ],
-            max_tokens=min(settings.max_tokens, 800),
-            temperature=0.8,
-            top_p=settings.top_p,
-        )
-        content = (resp.choices[0].message.content or "").strip()
+        content = await _complete_script(system, user, max_tokens=min(settings.max_tokens, 800))
         logger.info(f"인사말 스크립트 생성 완료 ({len(content)}자)")
         return {"script": content}
     except Exception as e:
@@ -1444,18 +2279,12 @@ async def create_news_script(request: NewsScriptRequest):
         # 뉴스: 없으면 백엔드에서 가져오기
         try:
             if request.news_items:
-                news_items = [
-                    {"title": (n.title or "")[:200], "summary": (n.summary or "")[:3000]}
-                    for n in request.news_items[:3]
-                ]
+                news_items = _news_items_from_articles(request.news_items[:3])
             else:
                 logger.info(f"뉴스 멘트용 뉴스 정보를 백엔드에서 가져오는 중... (section={request.news_section})")
                 articles = await fetch_news(section=request.news_section, page_size=3)
                 logger.info(f"뉴스 {len(articles)}건 수집 완료")
-                news_items = [
-                    {"title": (a.get("title") or "")[:200], "summary": (a.get("summary") or "")[:3000]}
-                    for a in articles[:3]
-                ]
+                news_items = _news_items_from_articles(articles[:3])
                 if not news_items:
                     logger.warning(f"뉴스 수집 실패 또는 빈 결과 (section={request.news_section})")
         except Exception as e:
@@ -1469,7 +2298,7 @@ async def create_news_script(request: NewsScriptRequest):
         
         logger.info(f"Azure OpenAI API 호출 중... (모델: {settings.model_name})")
         try:
-            resp = client.chat.completions.create(
+            resp = await azure_openai.chat_completion(
                 model=settings.model_name,
                 messages=[
                     {"role": "system", "content": system},
@@ -1520,10 +2349,14 @@ class NewsSegmentsRequest(BaseModel):
     news_items: Optional[list[NewsItemForScript]] = None
     news_section: str = "all"
     dj_name: Optional[str] = None  # DJ 이름 (첫 멘트에서 "DJ OO이 전해드리는 뉴스" 등 사용)
+    no_cache: bool = False  # true면 공유 대본 캐시를 쓰지 않고 매번 새로 생성 (다양한 멘트가 필요할 때)
 
 
 @app.post("/radio-script/news-segments")
-async def create_news_script_segments(request: NewsSegmentsRequest):
+async def create_news_script_segments(
+    request: NewsSegmentsRequest,
+    stream: bool = Query(False, description="true면 SSE로 토큰 스트리밍 + 멘트 완성마다 segment 이벤트"),
+):
     """뉴스 3건을 각각 짧은 멘트 3개로 생성. 인사말 없음. DJ 진행처럼 멘트 사이 자연스럽게 연결."""
     try:
         client = get_azure_client()
@@ -1535,43 +2368,29 @@ async def create_news_script_segments(request: NewsSegmentsRequest):
             )
         try:
             if request.news_items:
-                news_items = [
-                    {"title": (n.title or "")[:200], "summary": (n.summary or "")[:3000]}
-                    for n in request.news_items
-                ]
+                news_items = _news_items_from_articles(request.news_items)
             else:
                 articles = await fetch_news(section=request.news_section, page_size=5)
-                news_items = [
-                    {"title": (a.get("title") or "")[:200], "summary": (a.get("summary") or "")[:3000]}
-                    for a in articles
-                ]
+                news_items = _news_items_from_articles(articles)
         except Exception as e:
             logger.exception("뉴스 수집 실패: %s", e)
             news_items = []
 
         if not news_items:
-            return {"scripts": ["오늘은 전해드릴 뉴스가 없습니다."]}
-
-        n = len(news_items)
-        system, user = _build_news_segments_prompt(news_items, request.dj_name)
-        resp = client.chat.completions.create(
-            model=settings.model_name,
-            messages=[
-                {"role": "system", "content": system},
-                {"role": "user", "content": user},
-            ],
-            max_tokens=min(settings.max_tokens, 1200),
-            temperature=0.8,
-            top_p=settings.top_p,
-        )
-        content = (resp.choices[0].message.content or "").strip()
-        parts = [p.strip() for p in content.split("---NEXT---") if p.strip()]
-        if len(parts) >= n:
-            scripts = parts[:n]
-        elif len(parts) >= 1:
-            scripts = parts + ["이상 오늘의 뉴스였습니다."] * (n - len(parts))
-        else:
-            scripts = ["오늘의 뉴스를 간단히 전해드렸습니다."] * n
+            scripts = ["오늘은 전해드릴 뉴스가 없습니다."]
+            if stream:
+                async def empty_stream():
+                    yield _sse_event("segment", {"index": 0, "script": scripts[0]})
+                    yield _sse_event("done", {"scripts": scripts})
+                return StreamingResponse(empty_stream(), media_type="text/event-stream", headers=_SSE_HEADERS)
+            return {"scripts": scripts}
+
+        if stream:
+            system, user = _build_news_segments_prompt(news_items, request.dj_name)
+            return _sse_script_response(
+                system, user, max_tokens=min(settings.max_tokens, 1200), segments=len(news_items), use_cache=not request.no_cache
+            )
+        scripts = await _generate_news_segments(news_items, request.dj_name, use_cache=not request.no_cache)
         logger.info("뉴스 세그먼트 생성 완료: %d개", len(scripts))
         return {"scripts": scripts}
     except Exception as e:
@@ -1584,7 +2403,10 @@ async def create_news_script_segments(request: NewsSegmentsRequest):
 
 
 @app.post("/radio-script/closing")
-async def create_closing_script(request: ClosingScriptRequest):
+async def create_closing_script(
+    request: ClosingScriptRequest,
+    stream: bool = Query(False, description="true면 SSE로 토큰 스트리밍"),
+):
     """마무리말 스크립트 생성 (도착 시). 이전 스크립트의 톤을 유지하며 자연스럽게 마무리."""
     try:
         client = get_azure_client()
@@ -1603,19 +2425,11 @@ async def create_closing_script(request: ClosingScriptRequest):
         logger.info("마무리말 스크립트 프롬프트 생성 중...")
         system, user = _build_closing_prompt(request.previous_script)
         logger.info(f"프롬프트 생성 완료 (시스템: {len(system)}자, 사용자: {len(user)}자)")
+        if stream:
+            return _sse_script_response(system, user, max_tokens=min(settings.max_tokens, 500))
         
         logger.info(f"Azure OpenAI API 호출 중... (모델: {settings.model_name})")
-        resp = client.chat.completions.create(
-            model=settings.model_name,
-            messages=[
-                {"role": "system", "content": system},
-                {"role": "user", "content": user},
-            ],
-            max_tokens=min(settings.max_tokens, 500),
-            temperature=0.8,
-            top_p=settings.top_p,
-        )
-        content = (resp.choices[0].message.content or "").strip()
+        content = await _complete_script(system, user, max_tokens=min(settings.max_tokens, 500))
         logger.info(f"마무리말 스크립트 생성 완료 ({len(content)}자)")
         return {"script": content}
     except Exception as e:
@@ -1633,9 +2447,229 @@ async def create_closing_script(request: ClosingScriptRequest):
 
 TTS_URL = "https://naveropenapi.apigw.ntruss.com/tts-premium/v1/tts"
 
+_TTS_AUDIO_HEADERS = {
+    "Content-Disposition": "inline; filename=tts.mp3",
+    "Access-Control-Allow-Origin": "*",
+}
+
+
+class TTSUpstreamError(Exception):
+    """클로바 TTS가 200 이외 응답을 준 경우"""
+
+    def __init__(self, status_code: int, body: str):
+        super().__init__(f"TTS API 오류: {status_code}")
+        self.status_code = status_code
+        self.body = body
+
+
+def _tts_headers() -> dict:
+    return {
+        "X-NCP-APIGW-API-KEY-ID": settings.ncp_tts_client_id,
+        "X-NCP-APIGW-API-KEY": settings.ncp_tts_client_secret,
+    }
+
+
+def _tts_error_response(e: TTSUpstreamError) -> JSONResponse:
+    logger.warning("TTS API 응답 오류: status=%s body=%s", e.status_code, e.body)
+    return JSONResponse(
+        status_code=502,
+        content={"detail": str(e), "body": e.body},
+        headers={"Access-Control-Allow-Origin": "*"},
+    )
+
+
+@single_flight("tts", key=lambda payload: tts_cache.make_key(payload))
+async def _synthesize_tts(payload: dict) -> bytes:
+    """payload 1건 음성 합성 (캐시 우선). 업스트림 오류 시 TTSUpstreamError."""
+    cache_key = tts_cache.make_key(payload)
+    cached_path = tts_cache.get(cache_key)
+    if cached_path is not None:
+        return await asyncio.to_thread(cached_path.read_bytes)
+    resp = await http_clients.get("tts").post(TTS_URL, data=payload, headers=_tts_headers())
+    if resp.status_code != 200:
+        raise TTSUpstreamError(resp.status_code, resp.text[:500])
+    await asyncio.to_thread(tts_cache.put, cache_key, payload["format"], resp.content)
+    return resp.content
+
+
+# --- 긴 대본 분할 합성 (문장 단위 청크 병렬 합성 후 MP3 프레임 이어붙이기) ---
+# 문장 끝: 마침표/물음표/느낌표/말줄임/물결 뒤 공백, 또는 줄바꿈
+_TTS_SENTENCE_SPLIT = re.compile(r"(?<=[.!?。…~])\s+|\n+")
+_TTS_CLAUSE_SPLIT = re.compile(r"(?<=[,，])\s+|\s+")
+
+
+def _split_tts_text(text: str, max_chars: int) -> list[str]:
+    """문장 경계로 나눈 뒤 max_chars 이하 청크로 묶기. 한 문장이 너무 길면 쉼표/공백에서 자름."""
+    sentences = [s.strip() for s in _TTS_SENTENCE_SPLIT.split(text or "") if s and s.strip()]
+    pieces: list[str] = []
+    for sent in sentences:
+        if len(sent) <= max_chars:
+            pieces.append(sent)
+            continue
+        buf = ""
+        for word in _TTS_CLAUSE_SPLIT.split(sent):
+            if not word:
+                continue
+            while len(word) > max_chars:
+                if buf:
+                    pieces.append(buf)
+                    buf = ""
+                pieces.append(word[:max_chars])
+                word = word[max_chars:]
+            if buf and len(buf) + 1 + len(word) > max_chars:
+                pieces.append(buf)
+                buf = word
+            else:
+                buf = f"{buf} {word}" if buf else word
+        if buf:
+            pieces.append(buf)
+
+    chunks: list[str] = []
+    buf = ""
+    for piece in pieces:
+        if buf and len(buf) + 1 + len(piece) > max_chars:
+            chunks.append(buf)
+            buf = piece
+        else:
+            buf = f"{buf} {piece}" if buf else piece
+    if buf:
+        chunks.append(buf)
+    return chunks
+
+
+def _strip_mp3_tags(data: bytes, keep_id3v2: bool, keep_id3v1: bool) -> bytes:
+    """이어붙일 때 중간에 끼는 ID3 태그 제거 (앞: ID3v2 헤더, 뒤: 128바이트 ID3v1)"""
+    start, end = 0, len(data)
+    if not keep_id3v2 and data[:3] == b"ID3" and len(data) >= 10:
+        # ID3v2 크기: syncsafe 정수 4바이트 (+ footer 플래그 시 10바이트)
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        start = 10 + size + (10 if data[5] & 0x10 else 0)
+    if not keep_id3v1 and end - start >= 128 and data[end - 128:end - 125] == b"TAG":
+        end -= 128
+    return data[start:end]
+
+
+def _tts_chunk_payloads(payload: dict) -> list[dict]:
+    """분할 합성 대상이면 청크별 payload 목록, 아니면 빈 리스트"""
+    if (payload.get("format") or "mp3") != "mp3":
+        return []
+    chunks = _split_tts_text(payload["text"], max(50, settings.tts_chunk_max_chars))
+    if len(chunks) < 2:
+        return []
+    return [{**payload, "text": chunk} for chunk in chunks]
+
+
+async def _iter_tts_chunks(payloads: list[dict]):
+    """
+    청크들을 최대 tts_chunk_concurrency개씩 동시에 합성하고, 순서대로 MP3 바이트 반환.
+    첫 청크가 준비되는 즉시 반환하므로 전체 지연 ≈ 청크 1개 합성 시간.
+    """
+    semaphore = asyncio.Semaphore(max(1, settings.tts_chunk_concurrency))
+
+    async def synthesize(p: dict) -> bytes:
+        async with semaphore:
+            return await _synthesize_tts(p)
+
+    tasks = [asyncio.create_task(synthesize(p)) for p in payloads]
+    last = len(tasks) - 1
+    try:
+        for i, task in enumerate(tasks):
+            data = await task
+            yield _strip_mp3_tags(data, keep_id3v2=(i == 0), keep_id3v1=(i == last))
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+async def _chunked_tts_response(payloads: list[dict], cache_key: str, fmt: str, stream: bool):
+    """분할 합성 응답. 완성된 전체 음성은 원문 캐시 키로도 저장."""
+    chunks = _iter_tts_chunks(payloads)
+    try:
+        # 첫 청크는 응답 전에 받아 둠 (업스트림 오류를 502로 돌려주기 위해)
+        first = await chunks.__anext__()
+    except BaseException:
+        await chunks.aclose()
+        raise
+    headers = {**_TTS_AUDIO_HEADERS, "X-TTS-Cache": "MISS", "X-TTS-Chunks": str(len(payloads))}
+
+    if not stream:
+        parts = [first]
+        async for data in chunks:
+            parts.append(data)
+        audio = b"".join(parts)
+        await asyncio.to_thread(tts_cache.put, cache_key, fmt, audio)
+        return Response(content=audio, media_type="audio/mpeg", headers=headers)
+
+    writer = tts_cache.open_writer(cache_key, fmt)
+
+    async def relay():
+        completed = False
+        try:
+            if writer is not None:
+                writer.write(first)
+            yield first
+            async for data in chunks:
+                if writer is not None:
+                    writer.write(data)
+                yield data
+            completed = True
+        except TTSUpstreamError as e:
+            # 스트림 도중 실패: 이미 보낸 앞부분까지만 재생됨
+            logger.warning("TTS 분할 합성 중단: status=%s body=%s", e.status_code, e.body)
+        finally:
+            await chunks.aclose()
+            if writer is not None:
+                if completed:
+                    writer.commit()
+                else:
+                    writer.abort()
+
+    return StreamingResponse(relay(), media_type="audio/mpeg", headers=headers)
+
+
+async def _stream_tts_response(payload: dict, cache_key: str):
+    """클로바 TTS 응답 본문을 받는 즉시 클라이언트로 중계하면서 캐시 파일에도 기록."""
+    client = http_clients.get("tts")
+    upstream = await client.send(
+        client.build_request("POST", TTS_URL, data=payload, headers=_tts_headers()), stream=True
+    )
+    if upstream.status_code != 200:
+        await upstream.aread()
+        await upstream.aclose()
+        return _tts_error_response(TTSUpstreamError(upstream.status_code, upstream.text[:500]))
+    writer = tts_cache.open_writer(cache_key, payload["format"])
+
+    async def relay():
+        completed = False
+        try:
+            async for chunk in upstream.aiter_bytes():
+                if writer is not None:
+                    writer.write(chunk)
+                yield chunk
+            completed = True
+        finally:
+            await upstream.aclose()
+            if writer is not None:
+                # 클라이언트 연결 끊김 등으로 중단되면 불완전한 파일은 저장하지 않음
+                if completed:
+                    writer.commit()
+                else:
+                    writer.abort()
+
+    return StreamingResponse(
+        relay(),
+        media_type="audio/mpeg",
+        headers={**_TTS_AUDIO_HEADERS, "X-TTS-Cache": "MISS"},
+    )
+
 
 @app.post("/tts")
-async def text_to_speech(request: TTSRequest):
+async def text_to_speech(
+    request: TTSRequest,
+    stream: bool = Query(False, description="true면 업스트림 응답을 조각 단위로 그대로 중계 (첫 바이트 지연 감소)"),
+    chunked: bool = Query(False, description="true면 긴 텍스트를 문장 단위로 나눠 병렬 합성 후 이어붙임 (mp3만)"),
+):
     """텍스트를 음성(MP3)으로 변환 (네이버 클로바 TTS Premium). 인사말/뉴스/마무리말 재생용."""
     if not request.text or not request.text.strip():
         return JSONResponse(
@@ -1660,27 +2694,29 @@ async def text_to_speech(request: TTSRequest):
             "text": request.text.strip(),
             "format": request.format or "mp3",
         }
-        headers = {
-            "X-NCP-APIGW-API-KEY-ID": settings.ncp_tts_client_id,
-            "X-NCP-APIGW-API-KEY": settings.ncp_tts_client_secret,
-        }
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(TTS_URL, data=payload, headers=headers)
-        if resp.status_code != 200:
-            logger.warning("TTS API 응답 오류: status=%s body=%s", resp.status_code, resp.text[:500])
-            return JSONResponse(
-                status_code=502,
-                content={"detail": f"TTS API 오류: {resp.status_code}", "body": resp.text[:500]},
-                headers={"Access-Control-Allow-Origin": "*"},
+        cache_key = tts_cache.make_key(payload)
+        cached_path = tts_cache.get(cache_key)
+        if cached_path is not None:
+            return FileResponse(
+                cached_path,
+                media_type="audio/mpeg",
+                headers={**_TTS_AUDIO_HEADERS, "X-TTS-Cache": "HIT"},
             )
+        if chunked:
+            chunk_payloads = _tts_chunk_payloads(payload)
+            if chunk_payloads:
+                return await _chunked_tts_response(chunk_payloads, cache_key, payload["format"], stream)
+        if stream:
+            return await _stream_tts_response(payload, cache_key)
+        # 같은 문장 동시 요청은 업스트림 1회 (single-flight), 캐시 저장도 _synthesize_tts 에서
+        audio = await _synthesize_tts(payload)
         return Response(
-            content=resp.content,
+            content=audio,
             media_type="audio/mpeg",
-            headers={
-                "Content-Disposition": "inline; filename=tts.mp3",
-                "Access-Control-Allow-Origin": "*",
-            },
+            headers={**_TTS_AUDIO_HEADERS, "X-TTS-Cache": "MISS"},
         )
+    except TTSUpstreamError as e:
+        return _tts_error_response(e)
     except Exception as e:
         logger.exception("TTS 생성 중 예외: %s", e)
         return JSONResponse(
@@ -1720,18 +2756,12 @@ async def create_radio_script(request: RadioScriptRequest):
         # 뉴스: 없으면 백엔드에서 가져오기 (요약을 길게 가져와서 DJ가 상세히 말할 수 있도록)
         try:
             if request.news_items:
-                news_items = [
-                    {"title": (n.title or "")[:200], "summary": (n.summary or "")[:3000]}
-                    for n in request.news_items[:3]
-                ]
+                news_items = _news_items_from_articles(request.news_items[:3])
             else:
                 logger.info(f"뉴스 정보를 백엔드에서 가져오는 중... (section={request.news_section})")
                 articles = await fetch_news(section=request.news_section, page_size=3)
                 logger.info(f"뉴스 {len(articles)}건 수집 완료")
-                news_items = [
-                    {"title": (a.get("title") or "")[:200], "summary": (a.get("summary") or "")[:3000]}
-                    for a in articles[:3]
-                ]
+                news_items = _news_items_from_articles(articles[:3])
                 if not news_items:
                     logger.warning(f"뉴스 수집 실패 또는 빈 결과 (section={request.news_section}, api_key 설정 여부: {bool(settings.deepsearch_news_api_key)})")
         except Exception as e:
@@ -1747,7 +2777,7 @@ async def create_radio_script(request: RadioScriptRequest):
         logger.info(f"프롬프트 생성 완료 (시스템: {len(system)}자, 사용자: {len(user)}자)")
         
         logger.info(f"Azure OpenAI API 호출 중... (모델: {settings.model_name})")
-        resp = client.chat.completions.create(
+        resp = await azure_openai.chat_completion(
             model=settings.model_name,
             messages=[
                 {"role": "system", "content": system},
@@ -1773,6 +2803,251 @@ async def create_radio_script(request: RadioScriptRequest):
         )
 
 
+# --- 세션 시작 일괄 준비 (날씨·뉴스·음악·인사말·뉴스 멘트 동시 처리) ---
+class SessionBootstrapRequest(BaseModel):
+    """온보딩 직후 필요한 데이터를 한 번에 준비"""
+    dj_name: Optional[str] = None
+    user_name: Optional[str] = None
+    sections: Optional[list[str]] = None  # 관심 뉴스 섹션 (없으면 all)
+    news_count: int = 3  # 뉴스 멘트에 사용할 기사 수 (라디오 비율)
+    lat: float = 37.5665
+    lng: float = 126.9780
+    location_name: str = "서울"
+    music_query: Optional[str] = None  # 없으면 날씨 기반 검색어
+
+
+def _music_query_for_weather(weather_text: str) -> str:
+    """날씨 문구 → 추천 곡 검색어 (프론트 getMusicQueryForWeather와 동일 기준)"""
+    if any(k in weather_text for k in ("비", "눈", "소나기")):
+        return "rainy day jazz playlist"
+    if "맑음" in weather_text or "맑은" in weather_text:
+        return "morning city pop playlist"
+    return "morning pop playlist"
+
+
+async def _run_session_bootstrap(request: SessionBootstrapRequest):
+    """
+    의존 관계만 지키며 모든 작업을 동시에 실행하고, 끝나는 순서대로 (단계명, 결과) 반환.
+    weather → greeting / (music_query 없을 때) music,  news → news_segments.
+    한 단계가 실패해도 나머지는 계속 진행 (실패 단계는 결과 대신 {"error": ...}).
+    """
+    sections = [s.strip() for s in (request.sections or []) if s and s.strip()][:10]
+    news_count = max(1, min(request.news_count, 10))
+
+    async def weather_step() -> str:
+        return await fetch_weather_text(request.lat, request.lng, request.location_name)
+
+    async def news_step() -> list:
+        if sections:
+            return await fetch_news_per_sections(sections, per_section=1)
+        return await fetch_news(section="all", page_size=news_count)
+
+    weather_task = asyncio.create_task(weather_step())
+    news_task = asyncio.create_task(news_step())
+
+    async def greeting_step() -> str:
+        if not azure_openai.configured:
+            raise RuntimeError("Azure OpenAI가 설정되지 않았습니다.")
+        return await _generate_greeting_script(await weather_task, request.user_name, request.dj_name)
+
+    async def news_segments_step() -> list[str]:
+        if not azure_openai.configured:
+            raise RuntimeError("Azure OpenAI가 설정되지 않았습니다.")
+        articles = await news_task
+        news_items = _news_items_from_articles(articles[:news_count])
+        return await _generate_news_segments(news_items, request.dj_name)
+
+    async def music_step() -> dict:
+        query = request.music_query or _music_query_for_weather(await weather_task)
+        if settings.youtube_api_key:
+            try:
+                return {"query": query, "source": "youtube", "videos": await fetch_youtube_search(query)}
+            except YouTubeQuotaExceeded:
+                pass
+        return {"query": query, "source": "deezer", "tracks": await fetch_deezer_search(query)}
+
+    tasks = {
+        weather_task: "weather",
+        news_task: "news",
+        asyncio.create_task(greeting_step()): "greeting",
+        asyncio.create_task(news_segments_step()): "news_segments",
+        asyncio.create_task(music_step()): "music",
+    }
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                step = tasks[task]
+                try:
+                    yield step, task.result()
+                except Exception as e:
+                    logger.warning("세션 준비 단계 실패 (%s): %s", step, e)
+                    yield step, {"error": str(e)}
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _bootstrap_manifest(results: dict) -> dict:
+    """단계별 결과 → 최종 응답"""
+    def ok(step):
+        value = results.get(step)
+        return None if isinstance(value, dict) and set(value) == {"error"} else value
+
+    return {
+        "weather_text": ok("weather"),
+        "articles": ok("news") or [],
+        "greeting": ok("greeting"),
+        "news_scripts": ok("news_segments") or [],
+        "music": ok("music"),
+        "errors": {
+            step: value["error"]
+            for step, value in results.items()
+            if isinstance(value, dict) and set(value) == {"error"}
+        },
+    }
+
+
+@app.post("/session/bootstrap")
+async def session_bootstrap(
+    request: SessionBootstrapRequest,
+    stream: bool = Query(False, description="true면 단계가 끝날 때마다 SSE 이벤트로 전달"),
+):
+    """세션 시작에 필요한 날씨·뉴스·음악·인사말·뉴스 멘트를 동시에 준비해 한 번에 반환."""
+    if stream:
+        async def event_stream():
+            results = {}
+            try:
+                async for step, value in _run_session_bootstrap(request):
+                    results[step] = value
+                    yield _sse_event(step, {"step": step, "result": value})
+                yield _sse_event("done", _bootstrap_manifest(results))
+            except Exception as e:
+                logger.exception("세션 준비 스트리밍 중 예외: %s", e)
+                yield _sse_event("error", {"detail": str(e), "error": "session_bootstrap_failed"})
+
+        return StreamingResponse(event_stream(), media_type="text/event-stream", headers=_SSE_HEADERS)
+    try:
+        results = {}
+        async for step, value in _run_session_bootstrap(request):
+            results[step] = value
+        return _bootstrap_manifest(results)
+    except Exception as e:
+        logger.exception("세션 준비 중 예외: %s", e)
+        return JSONResponse(
+            status_code=500,
+            content={"detail": str(e), "error": "session_bootstrap_failed"},
+            headers={"Access-Control-Allow-Origin": "*"},
+        )
+
+
+# --- 출근 시간대 캐시 예열 ---
+DJ_SPEAKER_IDS = {"커순이": "vhyeri", "커돌이": "nes_c_kihyo"}  # 프론트 types.ts와 동일
+
+# 프론트 utils/musicQueries.ts MUSIC_SEARCH_PHRASES + 로딩 화면 고정 검색어
+MUSIC_PREWARM_QUERIES = [
+    "morning pop playlist",
+    "city pop mix",
+    "chill indie morning",
+    "wake up rock playlist",
+    "rainy day jazz",
+    "weekend morning jazz",
+    "dance pop hits",
+    "piano instrumental",
+    "chill electronic music",
+    "classical piano morning",
+    "아침을 깨우는 상쾌한 파워 팝송 플레이리스트",
+]
+
+
+def _parse_prewarm_cells(spec: str) -> list[tuple[float, float]]:
+    """ "37.56,126.97;37.49,127.02" → [(37.56, 126.97), (37.49, 127.02)]"""
+    cells = []
+    for part in (spec or "").split(";"):
+        try:
+            lat, lng = (float(v) for v in part.split(","))
+        except ValueError:
+            continue
+        cells.append((lat, lng))
+    return cells
+
+
+async def _prewarm_news_scripts(sections: list[str]) -> int:
+    """섹션 세트 하나의 뉴스 → DJ별 뉴스 멘트 + TTS (요청 경로와 같은 _news_items_from_articles 정규화라 캐시 키가 일치)"""
+    if sections and sections != ["all"]:
+        articles = await fetch_news_per_sections(sections, per_section=1)
+    else:
+        articles = await fetch_news(section="all", page_size=3)
+    news_items = _news_items_from_articles(articles[: settings.prewarm_news_count])
+    if not news_items or get_azure_client() is None:
+        return 0
+    tts_ready = bool(settings.ncp_tts_client_id and settings.ncp_tts_client_secret)
+    count = 0
+    for dj_name, speaker in DJ_SPEAKER_IDS.items():
+        scripts = await _generate_news_segments(news_items, dj_name)
+        count += len(scripts)
+        if not tts_ready:
+            continue
+        for script in scripts:
+            payload = {"speaker": speaker, "volume": "0", "speed": "0", "pitch": "0", "text": script.strip(), "format": "mp3"}
+            try:
+                await _synthesize_tts(payload)
+            except Exception as e:
+                logger.warning("예열 TTS 실패 (%s): %s", speaker, e)
+    return count
+
+
+async def prewarm_caches():
+    """
+    출근 시간대 직전에 공용 캐시를 채움: 전체 섹션 뉴스, 주요 지역 날씨, 추천 곡 검색, 뉴스 멘트·TTS.
+    단계별로 동시에 실행하고 실패는 로그만 남김.
+    """
+    async def news_step():
+        sections = ["all"] + [s for s in NEWS_SECTIONS_ALL.split(",") if s]
+        await asyncio.gather(*(fetch_news(section=sec, page_size=settings.news_cache_page_size) for sec in sections))
+        return len(sections)
+
+    async def weather_step():
+        cells = _parse_prewarm_cells(settings.prewarm_weather_cells)
+        await asyncio.gather(*(fetch_weather_text(lat, lng) for lat, lng in cells))
+        return len(cells)
+
+    async def music_step():
+        if not settings.youtube_api_key:
+            return 0
+        done = 0
+        for q in MUSIC_PREWARM_QUERIES:
+            try:
+                await fetch_youtube_search(q)
+            except YouTubeQuotaExceeded:
+                logger.warning("예열 중 YouTube 쿼터 소진, 음악 검색 예열 중단")
+                break
+            done += 1
+        return done
+
+    async def scripts_step():
+        section_sets = [
+            [s.strip() for s in spec.split(",") if s.strip()]
+            for spec in settings.prewarm_news_section_sets.split(";")
+            if spec.strip()
+        ]
+        counts = [await _prewarm_news_scripts(sections) for sections in section_sets]
+        return sum(counts)
+
+    steps = {"news": news_step(), "weather": weather_step(), "music": music_step()}
+    results = dict(zip(steps, await asyncio.gather(*steps.values(), return_exceptions=True)))
+    # 뉴스 멘트는 위에서 채운 뉴스 캐시를 그대로 사용
+    results["news_scripts"] = (await asyncio.gather(scripts_step(), return_exceptions=True))[0]
+    for name, result in results.items():
+        if isinstance(result, Exception):
+            logger.warning("캐시 예열 실패 (%s): %s", name, result)
+    logger.info("캐시 예열 결과: %s", {k: v for k, v in results.items() if not isinstance(v, Exception)})
+
+
+prewarm_scheduler = DailyScheduler("prewarm", parse_daily_times(settings.prewarm_times), prewarm_caches)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -0,0 +1,16 @@
+"""길찾기·경로 추적 계산 모듈"""
+from .geometry import RouteGeometry, RouteProjection
+from .station_refresher import StationRefresher
+from .subway_arrivals import SubwayArrival, parse_arrivals_json, parse_arrivals_xml
+from .tracker import ProgressTracker, TrackFix
+
+__all__ = [
+    "ProgressTracker",
+    "RouteGeometry",
+    "RouteProjection",
+    "StationRefresher",
+    "SubwayArrival",
+    "TrackFix",
+    "parse_arrivals_json",
+    "parse_arrivals_xml",
+]
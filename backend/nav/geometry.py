@@ -0,0 +1,102 @@
+"""
+경로 기하 인덱스 - 경로 포인트를 한 번만 평면 좌표(미터)로 변환해 두고,
+현재 위치의 최근접 포인트·최근접 구간 투영·진행률을 삼각함수 없이 계산
+"""
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Optional
+
+EARTH_RADIUS_M = 6371000.0
+
+
+@dataclass(frozen=True)
+class RouteProjection:
+    """경로 위 투영 결과"""
+    segment_index: int  # 포인트 segment_index → segment_index+1 구간
+    t: float  # 구간 내 위치 (0~1)
+    distance_m: float  # 현재 위치 ↔ 경로(선분) 거리
+    along_m: float  # 출발부터 투영점까지 경로 길이
+    progress: float  # along_m / 전체 길이 (0~1)
+
+
+class RouteGeometry:
+    """
+    등장방형(equirectangular) 근사: 경로 평균 위도 기준 cos 보정 후 평면 거리.
+    도시 규모(수십 km)에서 Haversine 대비 오차는 무시할 수준.
+    좌표는 x=경도, y=위도 (Kakao/ODsay와 동일).
+    """
+
+    def __init__(self, coords: list[tuple[float, float]]):
+        self.size = len(coords)
+        lat0 = sum(y for _, y in coords) / self.size if coords else 0.0
+        self._kx = math.radians(1.0) * EARTH_RADIUS_M * math.cos(math.radians(lat0))
+        self._ky = math.radians(1.0) * EARTH_RADIUS_M
+        self.xs = array("d", (x * self._kx for x, _ in coords))
+        self.ys = array("d", (y * self._ky for _, y in coords))
+        # cum[i]: 출발~포인트 i 경로 길이
+        self.cum = array("d", [0.0] * self.size)
+        for i in range(1, self.size):
+            self.cum[i] = self.cum[i - 1] + math.hypot(self.xs[i] - self.xs[i - 1], self.ys[i] - self.ys[i - 1])
+
+    @property
+    def total_m(self) -> float:
+        return self.cum[-1] if self.size else 0.0
+
+    def _to_plane(self, lat: float, lng: float) -> tuple[float, float]:
+        return lng * self._kx, lat * self._ky
+
+    def nearest_point(self, lat: float, lng: float, start: int = 0, stop: Optional[int] = None) -> tuple[int, float]:
+        """(최근접 포인트 인덱스, 거리 m). 포인트 [start, stop) 범위만 탐색. 같은 거리면 앞 포인트."""
+        px, py = self._to_plane(lat, lng)
+        xs, ys = self.xs, self.ys
+        start = max(0, start)
+        stop = self.size if stop is None else min(self.size, stop)
+        best_i, best_d2 = start, math.inf
+        for i in range(start, stop):
+            dx = xs[i] - px
+            dy = ys[i] - py
+            d2 = dx * dx + dy * dy
+            if d2 < best_d2:
+                best_i, best_d2 = i, d2
+        return best_i, math.sqrt(best_d2)
+
+    def project(self, lat: float, lng: float, start: int = 0, stop: Optional[int] = None) -> RouteProjection:
+        """현재 위치를 가장 가까운 선분에 투영. 선분 [start, stop) 범위만 탐색 (포인트 1개면 그 점)"""
+        px, py = self._to_plane(lat, lng)
+        xs, ys = self.xs, self.ys
+        if self.size < 2:
+            d = math.hypot(xs[0] - px, ys[0] - py) if self.size else 0.0
+            return RouteProjection(0, 0.0, d, 0.0, 0.0)
+        start = min(max(0, start), self.size - 2)
+        stop = self.size - 1 if stop is None else max(start + 1, min(self.size - 1, stop))
+        best = (math.inf, start, 0.0)
+        for i in range(start, stop):
+            ax, ay = xs[i], ys[i]
+            vx, vy = xs[i + 1] - ax, ys[i + 1] - ay
+            seg2 = vx * vx + vy * vy
+            t = ((px - ax) * vx + (py - ay) * vy) / seg2 if seg2 > 0 else 0.0
+            t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+            dx = ax + t * vx - px
+            dy = ay + t * vy - py
+            d2 = dx * dx + dy * dy
+            if d2 < best[0]:
+                best = (d2, i, t)
+        d2, i, t = best
+        along = self.cum[i] + t * (self.cum[i + 1] - self.cum[i])
+        total = self.total_m
+        return RouteProjection(i, t, math.sqrt(d2), along, along / total if total > 0 else 0.0)
+
+    def project_at(self, lat: float, lng: float, segment_index: int, t: float) -> RouteProjection:
+        """경로 위 고정 위치(segment_index 구간의 t)에 대한 투영 결과. distance_m 은 현재 위치 ↔ 그 위치 거리"""
+        px, py = self._to_plane(lat, lng)
+        xs, ys = self.xs, self.ys
+        if self.size < 2:
+            d = math.hypot(xs[0] - px, ys[0] - py) if self.size else 0.0
+            return RouteProjection(0, 0.0, d, 0.0, 0.0)
+        i = min(max(0, segment_index), self.size - 2)
+        x = xs[i] + t * (xs[i + 1] - xs[i])
+        y = ys[i] + t * (ys[i + 1] - ys[i])
+        along = self.cum[i] + t * (self.cum[i + 1] - self.cum[i])
+        total = self.total_m
+        return RouteProjection(i, t, math.hypot(x - px, y - py), along, along / total if total > 0 else 0.0)
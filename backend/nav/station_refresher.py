@@ -0,0 +1,61 @@
+"""
+역별 공유 갱신 타이머 - 구독자가 있는 역만 주기적으로 도착정보를 새로 받아 구독자에게 알림.
+같은 역을 보는 사용자가 몇 명이든 역당 타이머(업스트림 조회)는 1개
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class StationRefresher:
+    def __init__(self, fetch: Callable[[str], Awaitable[object]], interval: float):
+        self.fetch = fetch
+        self.interval = max(1.0, interval)
+        self._subscribers: dict[str, set[Callable[[], None]]] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def subscribe(self, station: str, notify: Callable[[], None]) -> Callable[[], None]:
+        """notify: 갱신 후 호출 (동기 함수, 예: asyncio.Event.set). 반환값을 호출하면 구독 해제."""
+        subscribers = self._subscribers.setdefault(station, set())
+        subscribers.add(notify)
+        if station not in self._tasks:
+            self._tasks[station] = asyncio.create_task(self._run(station))
+
+        def unsubscribe():
+            subs = self._subscribers.get(station)
+            if subs is None:
+                return
+            subs.discard(notify)
+            if not subs:
+                del self._subscribers[station]
+                task = self._tasks.pop(station, None)
+                if task is not None:
+                    task.cancel()
+
+        return unsubscribe
+
+    async def _run(self, station: str):
+        # 첫 조회는 구독 직후 이미 계산에 쓰였으므로 한 주기 뒤부터
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.fetch(station)
+            except Exception as e:
+                logger.warning("역 도착정보 갱신 실패 (%s): %s", station, e)
+                continue
+            for notify in list(self._subscribers.get(station, ())):
+                notify()
+
+    async def stop(self):
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        self._subscribers.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {"stations": len(self._tasks), "subscribers": sum(len(s) for s in self._subscribers.values())}
+
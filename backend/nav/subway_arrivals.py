@@ -0,0 +1,55 @@
+"""
+서울시 지하철 실시간 도착정보(realtimeStationArrival) 응답 파싱.
+필요한 5개 필드만 꺼내 같은 모양의 레코드로 반환 (JSON 응답이 XML보다 파싱이 훨씬 가벼움)
+"""
+import json
+import xml.etree.ElementTree as ET
+from typing import TypedDict
+
+
+class SubwayArrival(TypedDict):
+    subwayId: str  # 노선 ID (1002=2호선 등)
+    trainLineNm: str  # "성수행 - 역삼방면"
+    barvlDt: str  # 도착 예정 (초)
+    arvlMsg2: str  # "전역 도착" 등
+    bstatnNm: str  # 종착역
+
+
+ARRIVAL_FIELDS = ("subwayId", "trainLineNm", "barvlDt", "arvlMsg2", "bstatnNm")
+_OK_CODE = "INFO-000"
+
+
+def parse_arrivals_json(content: bytes) -> list[SubwayArrival]:
+    """JSON 응답 → 도착 레코드. 결과 없음(INFO-200 등)은 빈 리스트."""
+    data = json.loads(content)
+    status = data.get("errorMessage") or data
+    if status.get("code") != _OK_CODE:
+        return []
+    out = []
+    for row in data.get("realtimeArrivalList") or ():
+        out.append({
+            "subwayId": str(row.get("subwayId") or ""),
+            "trainLineNm": str(row.get("trainLineNm") or ""),
+            "barvlDt": str(row.get("barvlDt") or ""),
+            "arvlMsg2": str(row.get("arvlMsg2") or ""),
+            "bstatnNm": str(row.get("bstatnNm") or ""),
+        })
+    return out
+
+
+def parse_arrivals_xml(content: bytes) -> list[SubwayArrival]:
+    """XML 응답 → 도착 레코드. row마다 전체 자식 dict를 만들지 않고 필요한 태그만 조회."""
+    root = ET.fromstring(content)
+    code = root.findtext(".//code")
+    if code is not None and code != _OK_CODE:
+        return []
+    out = []
+    for row in root.iter("row"):
+        out.append({
+            "subwayId": row.findtext("subwayId") or "",
+            "trainLineNm": row.findtext("trainLineNm") or "",
+            "barvlDt": row.findtext("barvlDt") or "",
+            "arvlMsg2": row.findtext("arvlMsg2") or "",
+            "bstatnNm": row.findtext("bstatnNm") or "",
+        })
+    return out
@@ -0,0 +1,97 @@
+"""
+세션별 점진 추적기 - 직전 매칭 위치부터 앞쪽 구간만 탐색해 진행 위치가 뒤로 튀지 않게 하고,
+탑승 전/탑승 중 판정을 이력(hysteresis)이 있는 상태 기계로 관리
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from .geometry import RouteGeometry, RouteProjection
+
+BEFORE_BOARDING = "BEFORE_BOARDING"
+ON_BOARD = "ON_BOARD"
+
+
+@dataclass(frozen=True)
+class TrackFix:
+    """좌표 1건 매칭 결과"""
+    nearest_index: int
+    distance_m: float  # 최근접 포인트까지 거리
+    projection: RouteProjection
+    phase: str  # BEFORE_BOARDING | ON_BOARD (첫 지하철역이 없으면 항상 ON_BOARD)
+    at_station: bool  # 첫 지하철역 근처 (탑승 대기, 탑승 전 안내 문구에 사용)
+    rescanned: bool  # 전체 재탐색 여부 (첫 좌표 또는 경로 이탈)
+
+
+class ProgressTracker:
+    """
+    - 탐색 범위: 직전 포인트/구간부터 앞으로 window개 (좌표당 O(window))
+    - 경로 이탈(투영 거리 > corridor_m) 또는 첫 좌표: 전체 재탐색 후 상태 재판정
+    - 진행 위치는 재탐색 전까지 뒤로 가지 않음 (터널 등 GPS 흔들림 무시)
+    - 역 근처 판정: 들어올 때 station_threshold_m, 나갈 때 + hysteresis_m
+    - 탑승 판정: 다음 포인트 쪽으로 넘어가거나 첫 지하철역 반경을 진행 방향으로 벗어나면 ON_BOARD, 재탐색 전까지 유지
+    """
+
+    def __init__(
+        self,
+        geometry: RouteGeometry,
+        first_subway_index: Optional[int],
+        station_threshold_m: float,
+        window: int = 8,
+        corridor_m: float = 300.0,
+        hysteresis_m: float = 50.0,
+    ):
+        self.geometry = geometry
+        self.first_subway_index = first_subway_index
+        self.station_threshold_m = station_threshold_m
+        self.window = max(1, window)
+        self.corridor_m = corridor_m
+        self.hysteresis_m = hysteresis_m
+        self._nearest: Optional[int] = None
+        self._segment = 0
+        self._t = 0.0
+        self._along = 0.0
+        self._phase = BEFORE_BOARDING if first_subway_index is not None else ON_BOARD
+        self._at_station = False
+        self.rescans = 0
+
+    def _match_full(self, lat: float, lng: float) -> tuple[int, float, RouteProjection]:
+        nearest, dist = self.geometry.nearest_point(lat, lng)
+        return nearest, dist, self.geometry.project(lat, lng)
+
+    def _match_window(self, lat: float, lng: float) -> tuple[int, float, RouteProjection]:
+        nearest, dist = self.geometry.nearest_point(lat, lng, self._nearest, self._nearest + self.window + 1)
+        projection = self.geometry.project(lat, lng, self._segment, self._segment + self.window)
+        return nearest, dist, projection
+
+    def update(self, lat: float, lng: float) -> TrackFix:
+        rescanned = self._nearest is None
+        if not rescanned:
+            nearest, dist, projection = self._match_window(lat, lng)
+            rescanned = projection.distance_m > self.corridor_m
+        if rescanned:
+            self.rescans += 1
+            nearest, dist, projection = self._match_full(lat, lng)
+        elif projection.along_m < self._along:
+            # 뒤로 간 투영은 무시하고 직전 진행 위치(구간, t) 유지 (최근접 포인트는 창 탐색이 직전 인덱스부터라 뒤로 가지 않음)
+            projection = self.geometry.project_at(lat, lng, self._segment, self._t)
+        self._nearest, self._segment, self._t, self._along = nearest, projection.segment_index, projection.t, projection.along_m
+        self._advance_phase(nearest, dist, projection, reset=rescanned)
+        return TrackFix(nearest, dist, projection, self._phase, self._at_station, rescanned)
+
+    def _advance_phase(self, nearest: int, dist: float, projection: RouteProjection, reset: bool):
+        first = self.first_subway_index
+        if first is None:
+            self._phase = ON_BOARD
+            return
+        threshold = self.station_threshold_m + (self.hysteresis_m if self._at_station and not reset else 0.0)
+        self._at_station = nearest == first and dist <= threshold
+        if reset:
+            self._phase = BEFORE_BOARDING
+        # 다음 포인트가 더 가깝거나, 첫 역 반경을 경로 진행 방향으로 벗어남
+        passed_first = projection.along_m > self.geometry.cum[first] + self.station_threshold_m + self.hysteresis_m
+        if self._phase == BEFORE_BOARDING and (nearest > first or passed_first):
+            self._phase = ON_BOARD
+
+    @property
+    def phase(self) -> str:
+        return self._phase
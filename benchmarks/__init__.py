@@ -0,0 +1 @@
+"""성능 벤치마크 (python -m benchmarks.bench_nav 등, 저장소 루트에서 실행)"""
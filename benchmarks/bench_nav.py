@@ -0,0 +1,105 @@
+"""
+길찾기·추적 핫패스 벤치마크 (업스트림 호출 없음, 지하철 도착정보는 로컬 stub).
+
+    python -m benchmarks.bench_nav                # 전체 (지하철 1~4구간 × 역 5~60개)
+    python -m benchmarks.bench_nav --quick        # 작은 조합만
+    python -m benchmarks.bench_nav --json out.json
+
+측정 대상: _extract_nav_legs, _build_subway_route_info, _build_route_points, RouteGeometry
+(최근접 포인트·구간 투영, 이전 _distance_m 루프 대체), _filter_arrivals_by_direction,
+_compute_track_state (좌표마다 독립 / ProgressTracker 점진 추적)
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.harness import measure, print_table  # noqa: E402
+from benchmarks.synthetic import make_arrivals, make_odsay_path, make_trace, route_from_path  # noqa: E402
+
+SIZES_FULL = [(legs, stations) for legs in (1, 2, 3, 4) for stations in (5, 15, 30, 60)]
+SIZES_QUICK = [(1, 5), (2, 15), (4, 60)]
+
+
+def bench_size(nav, legs: int, stations: int, fixes: int, seed: int) -> list[dict]:
+    path = make_odsay_path(legs, stations, seed=seed)
+    route = route_from_path(path, nav)
+    points = nav._build_route_points(route)
+    compiled = nav._compile_route(route)
+    geometry = compiled["geometry"]
+    trace = make_trace(points, fixes, seed=seed)
+    arrivals = make_arrivals(route, seed=seed)
+    infos = nav._build_subway_route_info(route["legs"])
+    arrival_inputs = [(arrivals.get(info["station"], []), info) for info in infos] or [([], {"line": "", "stations": []})]
+
+    async def stub_lookup(station: str) -> list:
+        return arrivals.get(station, [])
+
+    async def track_stateless(fix):
+        return await nav._compute_track_state(
+            fix[0], fix[1], route, compiled["points"], geometry, None, stub_lookup
+        )
+
+    # measure()는 워밍업·측정 반복·할당 측정마다 inputs를 처음부터 다시 돌므로,
+    # 궤적 첫 좌표(인덱스 0)에서 추적기를 새로 만들어 매 회차가 같은 궤적 재생이 되게 함
+    indexed_trace = list(enumerate(trace))
+    tracker = None
+
+    async def track_incremental(item):
+        nonlocal tracker
+        i, fix = item
+        if i == 0:
+            tracker = nav._new_tracker(compiled)
+        return await nav._compute_track_state(
+            fix[0], fix[1], route, compiled["points"], geometry, tracker, stub_lookup
+        )
+
+    async def track_uncompiled(fix):
+        # 경로 세션 없이 route 전체를 받는 기존 /nav/track 방식 (포인트·기하 매번 생성)
+        return await nav._compute_track_state(fix[0], fix[1], route, arrivals_lookup=stub_lookup)
+
+    tag = f"[{legs}x{stations}]"
+    rows = [
+        measure(f"{tag} _extract_nav_legs", nav._extract_nav_legs, [path], repeat=200),
+        measure(f"{tag} _build_subway_route_info", nav._build_subway_route_info, [route["legs"]], repeat=500),
+        measure(f"{tag} _build_route_points", nav._build_route_points, [route], repeat=200),
+        measure(f"{tag} RouteGeometry()", lambda pts: nav._route_geometry(pts), [points], repeat=200),
+        measure(f"{tag} geometry.nearest_point", lambda f: geometry.nearest_point(*f), trace),
+        measure(f"{tag} geometry.project", lambda f: geometry.project(*f), trace),
+        measure(f"{tag} _filter_arrivals_by_direction", lambda a: nav._filter_arrivals_by_direction(*a), arrival_inputs, repeat=200),
+        measure(f"{tag} track (full route)", track_uncompiled, trace),
+        measure(f"{tag} track (route session)", track_stateless, trace),
+        measure(f"{tag} track (incremental)", track_incremental, indexed_trace),
+    ]
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="길찾기·추적 핫패스 벤치마크")
+    parser.add_argument("--quick", action="store_true", help="작은 조합만 실행")
+    parser.add_argument("--fixes", type=int, default=300, help="경로당 GPS 좌표 수")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    import backend.main as nav  # noqa: E402 (설정 로드 후 import)
+
+    all_rows = []
+    for legs, stations in SIZES_QUICK if args.quick else SIZES_FULL:
+        rows = bench_size(nav, legs, stations, args.fixes, args.seed)
+        print_table(rows)
+        print()
+        all_rows.extend(rows)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"fixes": args.fixes, "seed": args.seed, "results": all_rows}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+서울시 지하철 실시간 도착정보 파싱 마이크로 벤치마크: 기존 구현(전체 자식 dict 생성) vs XML 필요 태그만 vs JSON.
+
+    python -m benchmarks.bench_subway_parse
+    python -m benchmarks.bench_subway_parse --rows 5 10 --json out.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import xml.etree.ElementTree as ET
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from backend.nav.subway_arrivals import parse_arrivals_json, parse_arrivals_xml  # noqa: E402
+from benchmarks.harness import measure, print_table  # noqa: E402
+from benchmarks.synthetic import make_arrival_xml  # noqa: E402
+
+
+def legacy_parse(content: bytes) -> list:
+    """변경 전 _get_realtime_subway_arrival 의 파싱 부분 (비교 기준)"""
+    root = ET.fromstring(content)
+    code_el = root.find(".//code")
+    if code_el is not None and (code_el.text or "") != "INFO-000":
+        return []
+    out = []
+    for row in root.findall(".//row"):
+        info = {c.tag: c.text for c in row}
+        out.append({
+            "subwayId": info.get("subwayId", ""),
+            "trainLineNm": info.get("trainLineNm", ""),
+            "barvlDt": info.get("barvlDt", ""),
+            "arvlMsg2": info.get("arvlMsg2", ""),
+            "bstatnNm": info.get("bstatnNm", ""),
+        })
+    return out
+
+
+def make_rows(n: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        toward = rng.choice(["성수", "신도림", "까치산", "서울대입구"])
+        rows.append({
+            "subwayId": rng.choice(["1002", "1009", "1077"]),
+            "updnLine": rng.choice(["내선", "외선"]),
+            "trainLineNm": f"{toward}행 - 역삼방면",
+            "statnNm": "강남",
+            "barvlDt": str(rng.randint(0, 900)),
+            "btrainNo": str(2000 + i),
+            "bstatnNm": toward,
+            "recptnDt": "2026-01-05 08:10:00",
+            "arvlMsg2": f"{rng.randint(1, 9)}분 후 (선릉)",
+            "arvlMsg3": "선릉",
+            "arvlCd": "99",
+        })
+    return rows
+
+
+def make_arrival_json(rows: list[dict]) -> bytes:
+    """JSON 응답 (실제 API처럼 요청하지 않은 필드까지 포함)"""
+    body = {
+        "errorMessage": {"status": 200, "code": "INFO-000", "message": "정상 처리되었습니다.", "total": len(rows)},
+        "realtimeArrivalList": [
+            {"rowNum": i + 1, "selectedCount": len(rows), "totalCount": len(rows), **row} for i, row in enumerate(rows)
+        ],
+    }
+    return json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지하철 도착정보 파싱 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[2, 5, 10])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    all_rows = []
+    for n in args.rows:
+        rows = make_rows(n, args.seed)
+        xml_body = make_arrival_xml(rows)
+        json_body = make_arrival_json(rows)
+        expected = legacy_parse(xml_body)
+        assert parse_arrivals_xml(xml_body) == expected
+        assert parse_arrivals_json(json_body) == expected
+        results = [
+            measure(f"[{n} rows] legacy xml ({len(xml_body)}B)", legacy_parse, [xml_body], repeat=args.calls),
+            measure(f"[{n} rows] parse_arrivals_xml", parse_arrivals_xml, [xml_body], repeat=args.calls),
+            measure(f"[{n} rows] parse_arrivals_json ({len(json_body)}B)", parse_arrivals_json, [json_body], repeat=args.calls),
+        ]
+        print_table(results)
+        print()
+        all_rows.extend(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"seed": args.seed, "results": all_rows}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
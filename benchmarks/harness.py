@@ -0,0 +1,85 @@
+"""
+벤치마크 측정 도구 - 호출별 지연 백분위(p50/p90/p99/max)와 호출당 메모리 할당(tracemalloc)
+"""
+import asyncio
+import gc
+import inspect
+import time
+import tracemalloc
+from typing import Any, Callable
+
+
+def _percentile(sorted_values: list[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * p
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def measure(name: str, fn: Callable[[Any], Any], inputs: list, repeat: int = 1, alloc_samples: int = 200) -> dict:
+    """
+    inputs 각각으로 fn(x) 호출 (코루틴 함수면 같은 이벤트 루프에서 await).
+    1) 지연: tracemalloc 끈 상태로 repeat × len(inputs)회 측정
+    2) 할당: tracemalloc 켠 상태로 alloc_samples회 호출해 호출 중 최대 사용량 증가분(peak)의 평균·최대와
+       호출 후 남은 증가분(retained, 캐시·누수 확인용)의 평균
+    """
+    is_async = inspect.iscoroutinefunction(fn)
+    loop = asyncio.new_event_loop() if is_async else None
+
+    def call(x):
+        return loop.run_until_complete(fn(x)) if is_async else fn(x)
+
+    try:
+        for x in inputs[: min(len(inputs), 20)]:  # 워밍업
+            call(x)
+        gc.collect()
+        gc.disable()
+        timings = []
+        for _ in range(repeat):
+            for x in inputs:
+                t0 = time.perf_counter_ns()
+                call(x)
+                timings.append((time.perf_counter_ns() - t0) / 1000.0)
+        gc.enable()
+
+        samples = inputs[:alloc_samples] if len(inputs) >= alloc_samples else (inputs * (alloc_samples // max(1, len(inputs)) + 1))[:alloc_samples]
+        tracemalloc.start()
+        peak_total = 0
+        peak_max = 0
+        retained_total = 0
+        for x in samples:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            call(x)
+            after, peak = tracemalloc.get_traced_memory()
+            peak_total += max(0, peak - before)
+            peak_max = max(peak_max, peak - before)
+            retained_total += after - before
+        tracemalloc.stop()
+    finally:
+        gc.enable()
+        if loop is not None:
+            loop.close()
+
+    timings.sort()
+    return {
+        "name": name,
+        "calls": len(timings),
+        "p50_us": round(_percentile(timings, 0.50), 2),
+        "p90_us": round(_percentile(timings, 0.90), 2),
+        "p99_us": round(_percentile(timings, 0.99), 2),
+        "max_us": round(timings[-1], 2) if timings else 0.0,
+        "alloc_peak_avg_b": int(peak_total / max(1, len(samples))),
+        "alloc_peak_max_b": int(peak_max),
+        "retained_avg_b": int(retained_total / max(1, len(samples))),
+    }
+
+
+def print_table(rows: list[dict]):
+    cols = ("name", "calls", "p50_us", "p90_us", "p99_us", "max_us", "alloc_peak_avg_b", "alloc_peak_max_b", "retained_avg_b")
+    widths = {c: max(len(c), *(len(str(r[c])) for r in rows)) for c in cols}
+    print("  ".join(c.ljust(widths[c]) if c == "name" else c.rjust(widths[c]) for c in cols))
+    for r in rows:
+        print("  ".join(str(r[c]).ljust(widths[c]) if c == "name" else str(r[c]).rjust(widths[c]) for c in cols))
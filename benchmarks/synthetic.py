@@ -0,0 +1,143 @@
+"""
+벤치마크용 합성 데이터 - ODsay searchPubTransPathT 형태의 경로, 잡음 섞인 GPS 궤적, 지하철 도착정보 stub.
+seed가 같으면 항상 같은 데이터 (재현 가능)
+"""
+import math
+import random
+
+# 실제 노선 번호·ID (backend.main._SUBWAY_LINE_IDS 와 맞춤)
+_LINES = [("2호선", "1002", 2), ("9호선", "1009", 9), ("3호선", "1003", 3), ("신분당선", "1077", 0)]
+_M_PER_DEG_LAT = 111_320.0
+
+
+def _station_name(leg: int, i: int) -> str:
+    return f"합성{leg}-{i:02d}"
+
+
+def make_odsay_path(subway_legs: int, stations_per_leg: int, seed: int = 0) -> dict:
+    """
+    ODsay 경로 1건 (result.path[0] 형태). 도보 → (지하철 → 도보 환승)×N → 도보.
+    역 간격 약 1km, 노선마다 방향을 조금씩 틀어 실제 환승 경로처럼 꺾임.
+    """
+    rng = random.Random(seed)
+    x, y = 126.90 + rng.random() * 0.05, 37.45 + rng.random() * 0.05
+    sub_paths = [{"trafficType": 3, "sectionTime": 5, "distance": 400}]
+    heading = rng.uniform(0, math.pi / 2)
+    for leg in range(subway_legs):
+        line_name, _, code = _LINES[leg % len(_LINES)]
+        stations = []
+        for i in range(stations_per_leg):
+            stations.append({
+                "index": i,
+                "stationName": _station_name(leg, i),
+                "x": f"{x:.6f}",
+                "y": f"{y:.6f}",
+            })
+            step = 1000.0 / _M_PER_DEG_LAT
+            x += step * math.cos(heading) / math.cos(math.radians(y))
+            y += step * math.sin(heading)
+        last = stations[-1]
+        sub_paths.append({
+            "trafficType": 1,
+            "sectionTime": 2 * stations_per_leg,
+            "distance": 1000 * (stations_per_leg - 1),
+            "stationCount": stations_per_leg - 1,
+            "startName": stations[0]["stationName"],
+            "endName": last["stationName"],
+            "lane": [{"name": f"수도권 {line_name}", "subwayCode": code}],
+            "subwayCode": code,
+            "passStopList": {"stations": stations},
+        })
+        sub_paths.append({"trafficType": 3, "sectionTime": 3, "distance": 150})
+        x, y = float(last["x"]), float(last["y"])
+        heading += rng.uniform(-math.pi / 3, math.pi / 3)
+    return {
+        "info": {
+            "totalTime": sum(sp.get("sectionTime", 0) for sp in sub_paths),
+            "payment": 1550,
+            "busTransitCount": 0,
+            "subwayTransitCount": subway_legs,
+            "totalWalk": 550 + 150 * subway_legs,
+            "totalDistance": sum(sp.get("distance", 0) for sp in sub_paths),
+            "firstStartStation": sub_paths[1]["startName"] if subway_legs else "",
+            "lastEndStation": sub_paths[-2]["endName"] if subway_legs else "",
+        },
+        "subPath": sub_paths,
+    }
+
+
+def route_from_path(path: dict, nav) -> dict:
+    """/nav/route 응답 형태 (summary, legs, start/end 좌표). nav: backend.main 모듈"""
+    legs = nav._extract_nav_legs(path)
+    stations = [s for leg in legs for s in (leg.get("stations") or [])]
+    first, last = stations[0], stations[-1]
+    return {
+        "summary": nav._extract_nav_summary(path),
+        "legs": legs,
+        "start_coords": {"x": float(first["x"]) - 0.004, "y": float(first["y"]) - 0.002},
+        "end_coords": {"x": float(last["x"]) + 0.003, "y": float(last["y"]) + 0.002},
+    }
+
+
+def make_trace(points: list[dict], fixes: int, noise_m: float = 25.0, seed: int = 0) -> list[tuple[float, float]]:
+    """
+    경로 포인트를 따라 출발→도착 (lat, lng) 궤적. 가우시안 잡음 + 가끔 터널 구간처럼 뒤로 튀는 좌표.
+    points: _build_route_points 결과 (x=경도, y=위도)
+    """
+    rng = random.Random(seed)
+    coords = [(float(p["y"]), float(p["x"])) for p in points]
+    out = []
+    span = len(coords) - 1
+    for k in range(fixes):
+        pos = span * k / max(1, fixes - 1)
+        if rng.random() < 0.05:
+            pos = max(0.0, pos - rng.uniform(0.5, 2.0))  # GPS 드리프트
+        i = min(int(pos), span - 1)
+        t = pos - i
+        lat = coords[i][0] + (coords[i + 1][0] - coords[i][0]) * t
+        lng = coords[i][1] + (coords[i + 1][1] - coords[i][1]) * t
+        lat += rng.gauss(0, noise_m) / _M_PER_DEG_LAT
+        lng += rng.gauss(0, noise_m) / (_M_PER_DEG_LAT * math.cos(math.radians(lat)))
+        out.append((lat, lng))
+    return out
+
+
+def make_arrivals(route: dict, per_station: int = 8, seed: int = 0) -> dict[str, list[dict]]:
+    """역명 → 서울시 실시간 도착정보 형태 목록 (양방향·다른 노선 섞음, 필터링 부하용)"""
+    rng = random.Random(seed)
+    out: dict[str, list[dict]] = {}
+    for leg_idx, leg in enumerate(route["legs"]):
+        if leg.get("trafficType") != 1:
+            continue
+        stations = [s["stationName"] for s in leg.get("stations") or []]
+        line_id = next((lid for name, lid, _ in _LINES if name in (leg.get("lineName") or "")), "1002")
+        for name in stations:
+            rows = []
+            for j in range(per_station):
+                toward = stations[-1] if j % 2 == 0 else stations[0]
+                rows.append({
+                    "subwayId": line_id if j % 4 != 3 else "1001",
+                    "trainLineNm": f"{toward}행 - {rng.choice(stations)}방면",
+                    "barvlDt": str(rng.randint(0, 900)),
+                    "arvlMsg2": f"{rng.randint(1, 9)}분 후",
+                    "bstatnNm": toward,
+                })
+            out[name] = rows
+    return out
+
+
+def make_arrival_xml(rows: list[dict]) -> bytes:
+    """서울시 realtimeStationArrival XML 응답 (파서 벤치마크용)"""
+    fields = ("subwayId", "updnLine", "trainLineNm", "statnNm", "barvlDt", "btrainNo", "bstatnNm", "recptnDt", "arvlMsg2", "arvlMsg3", "arvlCd")
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?><realtimeStationArrival>'
+        f"<RESULT><code>INFO-000</code><message>정상 처리되었습니다.</message></RESULT><total>{len(rows)}</total>"
+    ]
+    for i, row in enumerate(rows):
+        parts.append("<row>")
+        parts.append(f"<rowNum>{i + 1}</rowNum><selectedCount>{len(rows)}</selectedCount><totalCount>{len(rows)}</totalCount>")
+        for f in fields:
+            parts.append(f"<{f}>{row.get(f, '0')}</{f}>")
+        parts.append("</row>")
+    parts.append("</realtimeStationArrival>")
+    return "".join(parts).encode("utf-8")
@@ -64,13 +64,21 @@ export const api = {
     return res.json();
   },
 
-  /** 장소 자동완성 (Kakao 로컬 API). 설정 화면 집/회사 위치 입력용 */
-  async getPlaceAutocomplete(query: string): Promise<{ results: Array<{ name: string; address: string; category: string; x: string; y: string }> }> {
+  /**
+   * 장소 자동완성 (Kakao 로컬 API). 설정 화면 집/회사 위치 입력용
+   * session: 입력창별 임의 ID. 같은 세션의 새 요청이 오면 서버가 이전 요청을 superseded로 끝냄 (결과 무시)
+   */
+  async getPlaceAutocomplete(
+    query: string,
+    session?: string
+  ): Promise<{ results: Array<{ name: string; address: string; category: string; x: string; y: string }>; superseded?: boolean }> {
     if (!query?.trim()) return { results: [] };
-    const res = await fetch(`${API_BASE}/place/autocomplete?q=${encodeURIComponent(query.trim())}`);
+    const params = new URLSearchParams({ q: query.trim() });
+    if (session) params.set('session', session);
+    const res = await fetch(`${API_BASE}/place/autocomplete?${params.toString()}`);
     if (!res.ok) return { results: [] };
     const data = await res.json().catch(() => ({ results: [] }));
-    return { results: data.results ?? [] };
+    return { results: data.results ?? [], superseded: Boolean(data.superseded) };
   },
 
   /** 대중교통 경로 검색 (출발=집, 도착=회사). ODsay */
@@ -87,17 +95,26 @@ export const api = {
     return res.json();
   },
 
-  /** 실시간 GPS 기반 경로 추적 (탑승 전 열차 도착 시간 / 탑승 중 환승·하차 알림) */
+  /**
+   * 실시간 GPS 기반 경로 추적 (탑승 전 열차 도착 시간 / 탑승 중 환승·하차 알림)
+   * routeId가 있으면 좌표만 전송하고, 서버 경로 세션이 만료됐으면(404) 경로 전체로 한 번 더 요청
+   * trackerId: 화면별 임의 ID. 서버가 이전 위치부터 이어서 추적 (GPS 흔들림에 진행 위치가 뒤로 가지 않음)
+   */
   async getTrackPosition(
     route: { summary: object; legs: object[]; start_coords: { x: number; y: number }; end_coords: { x: number; y: number } },
     lat: number,
-    lng: number
+    lng: number,
+    routeId?: string,
+    trackerId?: string
   ) {
-    const res = await fetch(`${API_BASE}/nav/track`, {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ lat, lng, route }),
-    });
+    const post = (body: object) =>
+      fetch(`${API_BASE}/nav/track`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(body),
+      });
+    let res = routeId ? await post({ route_id: routeId, tracker_id: trackerId, lat, lng }) : await post({ lat, lng, route });
+    if (routeId && res.status === 404) res = await post({ lat, lng, route });
     if (!res.ok) {
       const err = await res.json().catch(() => ({}));
       throw new Error((err as { detail?: string }).detail || res.statusText || '위치 추적 실패');
@@ -105,6 +122,14 @@ export const api = {
     return res.json();
   },
 
+  /** 실시간 경로 추적 푸시 채널 URL (WebSocket). 좌표를 보내면 상태가 바뀔 때만 응답 */
+  trackSocketUrl(routeId: string): string {
+    const url = new URL(`${API_BASE}/nav/track/ws`, window.location.href);
+    url.protocol = url.protocol === 'https:' ? 'wss:' : 'ws:';
+    url.searchParams.set('route_id', routeId);
+    return url.toString();
+  },
+
   // 뉴스 (단일 섹션 또는 여러 섹션에서 각 1건씩)
   async getNews(sectionOrSections: string | string[] = 'all'): Promise<{ articles: Array<{ title: string; summary: string; url: string; publishedAt?: string; source?: string }> }> {
     const params = new URLSearchParams();
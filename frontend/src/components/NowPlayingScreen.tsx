@@ -166,11 +166,16 @@ export default function NowPlayingScreen({
     return () => { cancelled = true; };
   }, [data.startLocation, data.companyLocation]);
 
-  // 실시간 GPS 기반 경로 추적 (주기 폴링, 터널 등 오차 고려해 18초 간격)
+  // 실시간 GPS 기반 경로 추적: route_id가 있으면 WebSocket 푸시, 아니면(또는 연결 실패 시) 주기 폴링 (18초 간격)
   const TRACK_POLL_INTERVAL_MS = 18000;
   useEffect(() => {
     if (!routeData || !navigator.geolocation) return;
     let cancelled = false;
+    let intervalId: ReturnType<typeof setInterval> | null = null;
+    let watchId: number | null = null;
+    let socket: WebSocket | null = null;
+    const trackerId = Math.random().toString(36).slice(2, 10);
+
     const fetchPositionAndTrack = () => {
       if (cancelled) return;
       navigator.geolocation.getCurrentPosition(
@@ -184,7 +189,7 @@ export default function NowPlayingScreen({
             end_coords: routeData.end_coords,
           };
           api
-            .getTrackPosition(route, latitude, longitude)
+            .getTrackPosition(route, latitude, longitude, routeData.route_id, trackerId)
             .then((res) => {
               if (!cancelled) setTrackStatus(res);
             })
@@ -201,11 +206,58 @@ export default function NowPlayingScreen({
         { enableHighAccuracy: true, timeout: 8000, maximumAge: 10000 }
       );
     };
-    fetchPositionAndTrack();
-    const intervalId = setInterval(fetchPositionAndTrack, TRACK_POLL_INTERVAL_MS);
+    const startPolling = () => {
+      if (cancelled || intervalId) return;
+      fetchPositionAndTrack();
+      intervalId = setInterval(fetchPositionAndTrack, TRACK_POLL_INTERVAL_MS);
+    };
+
+    const startPush = (routeId: string) => {
+      let lastFix: { lat: number; lng: number } | null = null;
+      const sendFix = () => {
+        if (lastFix && socket?.readyState === WebSocket.OPEN) socket.send(JSON.stringify(lastFix));
+      };
+      const stopPush = () => {
+        if (watchId !== null) navigator.geolocation.clearWatch(watchId);
+        watchId = null;
+        if (intervalId) clearInterval(intervalId);
+        intervalId = null;
+      };
+      socket = new WebSocket(api.trackSocketUrl(routeId));
+      socket.onopen = () => {
+        watchId = navigator.geolocation.watchPosition(
+          (pos) => {
+            lastFix = { lat: pos.coords.latitude, lng: pos.coords.longitude };
+            sendFix();
+          },
+          () => {
+            if (!cancelled) setTrackStatus(null);
+          },
+          { enableHighAccuracy: true, timeout: 8000, maximumAge: 10000 }
+        );
+        // 위치가 그대로여도 연결 유지용으로 마지막 좌표 재전송 (서버는 상태가 같으면 응답 안 함)
+        intervalId = setInterval(sendFix, TRACK_POLL_INTERVAL_MS);
+      };
+      socket.onmessage = (ev) => {
+        if (cancelled) return;
+        const msg = JSON.parse(ev.data);
+        if (msg.type === 'state') setTrackStatus(msg as TrackPositionResponse);
+      };
+      socket.onclose = () => {
+        stopPush();
+        socket = null;
+        // 만료·연결 끊김 → 폴링으로 전환 (폴링은 route 전체 재전송으로 복구)
+        if (!cancelled) startPolling();
+      };
+    };
+
+    if (routeData.route_id && 'WebSocket' in window) startPush(routeData.route_id);
+    else startPolling();
     return () => {
       cancelled = true;
-      clearInterval(intervalId);
+      if (intervalId) clearInterval(intervalId);
+      if (watchId !== null) navigator.geolocation.clearWatch(watchId);
+      socket?.close();
     };
   }, [routeData]);
 
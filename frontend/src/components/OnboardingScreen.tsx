@@ -38,6 +38,8 @@ export default function OnboardingScreen({ onComplete, onClose }: Props) {
   const [companySelectedIndex, setCompanySelectedIndex] = useState(-1);
   const companyAutocompleteRef = useRef<HTMLDivElement>(null);
   const autocompleteTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+  // 입력창별 자동완성 세션 ID (서버가 같은 세션의 이전 요청을 먼저 끝냄)
+  const autocompleteSessionRef = useRef(Math.random().toString(36).slice(2, 10));
   const [djName, setDjName] = useState<'커돌이' | '커순이'>('커순이');
   const [radioRatio, setRadioRatio] = useState(3);
   const [musicRatio, setMusicRatio] = useState(1);
@@ -65,7 +67,8 @@ export default function OnboardingScreen({ onComplete, onClose }: Props) {
       setStartDropdownOpen(false);
       return;
     }
-    api.getPlaceAutocomplete(query).then(({ results }) => {
+    api.getPlaceAutocomplete(query, `${autocompleteSessionRef.current}-start`).then(({ results, superseded }) => {
+      if (superseded) return;
       setStartSuggestions(results);
       setStartSelectedIndex(-1);
       setStartDropdownOpen(results.length > 0);
@@ -106,7 +109,8 @@ export default function OnboardingScreen({ onComplete, onClose }: Props) {
       setCompanyDropdownOpen(false);
       return;
     }
-    api.getPlaceAutocomplete(query).then(({ results }) => {
+    api.getPlaceAutocomplete(query, `${autocompleteSessionRef.current}-company`).then(({ results, superseded }) => {
+      if (superseded) return;
       setCompanySuggestions(results);
       setCompanySelectedIndex(-1);
       setCompanyDropdownOpen(results.length > 0);
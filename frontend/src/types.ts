@@ -130,6 +130,8 @@ export interface NavRouteResult {
   start_coords: { x: number; y: number };
   end_coords: { x: number; y: number };
   realtime_subway?: Record<string, RealtimeArrival[]>;
+  /** 서버 경로 세션 ID (/nav/track 에 좌표와 함께 전송) */
+  route_id?: string;
 }
 
 /** 실시간 GPS 기반 경로 추적 응답 */
@@ -144,4 +146,8 @@ export interface TrackPositionResponse {
   nearest_index?: number;
   /** 경로 전체 포인트 수 */
   total_points?: number;
+  /** 현재 위치가 투영된 경로 구간 (포인트 segment_index → segment_index+1) */
+  segment_index?: number;
+  /** 경로 전체 길이 대비 진행률 (0~1) */
+  progress?: number;
 }
@@ -0,0 +1,90 @@
+"""경로 세션 - 메모리 캐시가 사라져도(다른 워커·재시작) 추적이 이어지는 동안 MongoDB 사본으로 복원"""
+import asyncio
+import time
+
+import pytest
+
+import backend.main as m
+from benchmarks.synthetic import make_odsay_path, route_from_path
+
+
+class FakeStore:
+    """MongoCacheStore 와 같은 get/set/touch (만료는 time.time 기준)"""
+
+    def __init__(self):
+        self.docs: dict[str, tuple[object, float]] = {}
+        self.writes = 0
+
+    async def get(self, key):
+        doc = self.docs.get(key)
+        if doc is None:
+            return None
+        return doc[0], doc[1] > time.time()
+
+    async def set(self, key, value, ttl, stale_ttl=0.0):
+        self.writes += 1
+        self.docs[key] = (value, time.time() + ttl)
+
+    async def touch(self, key, ttl, stale_ttl=0.0):
+        if key in self.docs:
+            self.writes += 1
+            self.docs[key] = (self.docs[key][0], time.time() + ttl)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def store(monkeypatch):
+    fake = FakeStore()
+    monkeypatch.setattr(m, "nav_route_session_store", fake)
+    for cache in (m.nav_route_sessions, m.nav_route_session_touched):
+        monkeypatch.setattr(cache, "_data", type(cache._data)())
+    return fake
+
+
+def _route() -> dict:
+    return route_from_path(make_odsay_path(subway_legs=1, stations_per_leg=4), m)
+
+
+def _restart():
+    """다른 워커 / 재시작: 프로세스 내 캐시 없음"""
+    m.nav_route_sessions._data.clear()
+    m.nav_route_session_touched._data.clear()
+
+
+def test_session_outlives_first_ttl_while_tracking(clock, store):
+    ttl = m.settings.nav_route_session_ttl
+    route_id = asyncio.run(m.register_route_session(_route()))
+    for _ in range(4):  # TTL/2 마다 추적 요청, 매번 다른 워커가 받음
+        clock[0] += ttl / 2
+        _restart()
+        assert asyncio.run(m.get_route_session(route_id)) is not None
+    # 추적이 끊기면 만료
+    clock[0] += ttl + 1
+    _restart()
+    assert asyncio.run(m.get_route_session(route_id)) is None
+
+
+def test_store_touch_is_throttled(clock, store):
+    route_id = asyncio.run(m.register_route_session(_route()))
+    writes = store.writes
+    for _ in range(10):
+        clock[0] += 5.0
+        asyncio.run(m.get_route_session(route_id))
+    assert store.writes == writes
+    clock[0] += m.settings.nav_route_session_touch_interval
+    asyncio.run(m.get_route_session(route_id))
+    assert store.writes == writes + 1
+
+
+def test_register_always_upserts(clock, store):
+    route = _route()
+    route_id = asyncio.run(m.register_route_session(route))
+    store.docs.clear()  # 다른 워커에서 만료·삭제된 상태
+    assert asyncio.run(m.register_route_session(route)) == route_id
+    assert route_id in store.docs
@@ -0,0 +1,34 @@
+"""_compute_track_state - 역 근처 판정이 탑승 전 안내 문구에 반영되는지"""
+import asyncio
+
+import pytest
+
+import backend.main as m
+from benchmarks.synthetic import make_odsay_path, route_from_path
+
+
+async def _no_arrivals(station_name: str) -> list:
+    return []
+
+
+@pytest.mark.parametrize("with_tracker", [True, False])
+def test_before_boarding_message_follows_at_station(with_tracker):
+    compiled = m._compile_route(route_from_path(make_odsay_path(subway_legs=1, stations_per_leg=4), m))
+    points = compiled["points"]
+    tracker = m._new_tracker(compiled) if with_tracker else None
+    fixes = [points[0], points[compiled["first_subway_idx"]]]  # 출발지 → 첫 지하철역
+
+    async def run():
+        return [
+            await m._compute_track_state(
+                float(p["y"]), float(p["x"]), compiled["route"], points, compiled["geometry"],
+                tracker=tracker, arrivals_lookup=_no_arrivals,
+            )
+            for p in fixes
+        ]
+
+    walking, waiting = asyncio.run(run())
+    name = waiting["stationName"]
+    assert walking["state"] == waiting["state"] == "BEFORE_BOARDING"
+    assert walking["message"] == f"{name}역으로 이동 중입니다."
+    assert waiting["message"] == f"{name}에서 열차를 기다리는 중입니다."
@@ -0,0 +1,76 @@
+"""ProgressTracker - 뒤로 튀는 GPS 좌표에서 매칭 결과 일관성·역 근처 판정 안정성"""
+import math
+
+import pytest
+
+from backend.nav import ProgressTracker, RouteGeometry
+from backend.nav.tracker import BEFORE_BOARDING
+
+LAT0 = 37.5
+STEP_M = 100.0
+M_PER_DEG_LAT = math.radians(1.0) * 6371000.0
+M_PER_DEG_LNG = M_PER_DEG_LAT * math.cos(math.radians(LAT0))
+FIRST_SUBWAY = 3
+
+
+def _at(along_m: float, lateral_m: float = 0.0) -> tuple[float, float]:
+    """동쪽으로 뻗은 직선 경로 위 along_m 지점에서 북쪽으로 lateral_m 떨어진 (lat, lng)"""
+    return LAT0 + lateral_m / M_PER_DEG_LAT, 127.0 + along_m / M_PER_DEG_LNG
+
+
+@pytest.fixture
+def geometry() -> RouteGeometry:
+    return RouteGeometry([(lng, lat) for lat, lng in (_at(i * STEP_M) for i in range(12))])
+
+
+def _tracker(geometry: RouteGeometry) -> ProgressTracker:
+    return ProgressTracker(geometry, FIRST_SUBWAY, station_threshold_m=100.0, window=4, corridor_m=300.0, hysteresis_m=50.0)
+
+
+def _assert_consistent(geometry: RouteGeometry, lat: float, lng: float, fix):
+    idx = fix.nearest_index
+    assert fix.distance_m == pytest.approx(geometry.nearest_point(lat, lng, idx, idx + 1)[1])
+    p = fix.projection
+    expected = geometry.project_at(lat, lng, p.segment_index, p.t)
+    assert p.along_m == pytest.approx(expected.along_m)
+    assert p.distance_m == pytest.approx(expected.distance_m)
+    assert p.progress == pytest.approx(expected.progress)
+
+
+def test_backward_jitter_keeps_consistent_position(geometry):
+    tracker = _tracker(geometry)
+    trace = [
+        _at(50), _at(250, 20), _at(420, -15), _at(330, 10),  # 다음 구간에서 이전 구간으로 튐
+        _at(180, 30), _at(440), _at(560, -10), _at(505, 5), _at(610),
+    ]
+    last_along, last_nearest = -1.0, -1
+    for lat, lng in trace:
+        fix = tracker.update(lat, lng)
+        _assert_consistent(geometry, lat, lng, fix)
+        assert fix.projection.along_m >= last_along
+        assert fix.nearest_index >= last_nearest
+        last_along, last_nearest = fix.projection.along_m, fix.nearest_index
+    assert tracker.rescans == 1
+
+
+def test_backward_hold_keeps_segment_and_t(geometry):
+    tracker = _tracker(geometry)
+    tracker.update(*_at(50))
+    ahead = tracker.update(*_at(420, -15)).projection
+    held = tracker.update(*_at(330, 10)).projection
+    assert (held.segment_index, held.t, held.along_m) == pytest.approx((ahead.segment_index, ahead.t, ahead.along_m))
+
+
+def test_waiting_at_station_does_not_flap(geometry):
+    tracker = _tracker(geometry)
+    station = FIRST_SUBWAY * STEP_M
+    tracker.update(*_at(station - 150))
+    assert tracker.update(*_at(station - 20)).at_station
+    # 탑승 대기 중 앞뒤로 흔들림: 진입 반경(100m)은 넘지만 이탈 반경(150m) 안
+    for offset, lateral in [(-120, 10), (30, -20), (-130, 0), (40, 15), (-110, -30), (0, 5)]:
+        lat, lng = _at(station + offset, lateral)
+        fix = tracker.update(lat, lng)
+        _assert_consistent(geometry, lat, lng, fix)
+        assert fix.nearest_index == FIRST_SUBWAY
+        assert fix.at_station
+        assert fix.phase == BEFORE_BOARDING